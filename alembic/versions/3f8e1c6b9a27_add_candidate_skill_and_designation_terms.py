@@ -0,0 +1,77 @@
+"""add candidate_skills and candidate_designations tables
+
+Revision ID: 3f8e1c6b9a27
+Revises: b6f2d8a4c391
+Create Date: 2026-10-17 16:48:53.112906
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.utils.normalization import normalize_terms
+
+
+# revision identifiers, used by Alembic.
+revision = '3f8e1c6b9a27'
+down_revision = 'b6f2d8a4c391'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    for table in ('candidate_skills', 'candidate_designations'):
+        op.create_table(
+            table,
+            sa.Column('candidate_id', sa.Integer(), nullable=False),
+            sa.Column('term', sa.Text(), nullable=False),
+            sa.PrimaryKeyConstraint('candidate_id', 'term'),
+            sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ondelete='CASCADE'),
+        )
+
+    # Backfill from the JSON columns with the same canonicalization the app uses
+    bind = op.get_bind()
+    candidates = sa.table(
+        'candidates',
+        sa.column('id', sa.Integer),
+        sa.column('skills', sa.JSON),
+        sa.column('designations', sa.JSON),
+    )
+    skills_table = sa.table('candidate_skills', sa.column('candidate_id', sa.Integer), sa.column('term', sa.Text))
+    designations_table = sa.table('candidate_designations', sa.column('candidate_id', sa.Integer), sa.column('term', sa.Text))
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(candidates.c.id, candidates.c.skills, candidates.c.designations)
+            .where(candidates.c.id > last_id)
+            .order_by(candidates.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        for table, column in ((skills_table, 'skills'), (designations_table, 'designations')):
+            values = [
+                {'candidate_id': row.id, 'term': term}
+                for row in rows
+                if isinstance(getattr(row, column), list)
+                for term in normalize_terms(getattr(row, column))
+            ]
+            if values:
+                bind.execute(table.insert(), values)
+        last_id = rows[-1].id
+
+    op.create_index(
+        'ix_candidate_skills_term', 'candidate_skills', ['term'],
+        unique=False, postgresql_ops={'term': 'text_pattern_ops'},
+    )
+    op.create_index(
+        'ix_candidate_designations_term', 'candidate_designations', ['term'],
+        unique=False, postgresql_ops={'term': 'text_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidate_designations_term', table_name='candidate_designations')
+    op.drop_index('ix_candidate_skills_term', table_name='candidate_skills')
+    op.drop_table('candidate_designations')
+    op.drop_table('candidate_skills')
@@ -0,0 +1,26 @@
+"""add file_hash to candidates
+
+Revision ID: 5d2e8b1c9f47
+Revises: c4bf82546c55
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e8b1c9f47'
+down_revision = 'c4bf82546c55'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('file_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_candidates_file_hash'), 'candidates', ['file_hash'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_candidates_file_hash'), table_name='candidates')
+    op.drop_column('candidates', 'file_hash')
@@ -0,0 +1,23 @@
+"""add (created_at, id) index to candidates for keyset pagination
+
+Revision ID: 5e9a1d3c7b42
+Revises: a2c7e9f4b815
+Create Date: 2026-10-17 21:10:45.387102
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5e9a1d3c7b42'
+down_revision = 'a2c7e9f4b815'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_candidates_created_at_id', 'candidates', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidates_created_at_id', table_name='candidates')
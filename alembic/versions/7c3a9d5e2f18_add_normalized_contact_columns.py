@@ -0,0 +1,65 @@
+"""add normalized email and phone columns to candidates
+
+Revision ID: 7c3a9d5e2f18
+Revises: e41f7a3b8c25
+Create Date: 2026-10-17 14:05:22.571930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.utils.normalization import normalize_email, normalize_phone
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3a9d5e2f18'
+down_revision = 'e41f7a3b8c25'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('email_normalized', sa.String(), nullable=True))
+    op.add_column('candidates', sa.Column('phone_normalized', sa.String(), nullable=True))
+
+    # Backfill in batches; phone normalization needs phonenumbers so it runs in Python
+    bind = op.get_bind()
+    candidates = sa.table(
+        'candidates',
+        sa.column('id', sa.Integer),
+        sa.column('email', sa.String),
+        sa.column('phone', sa.String),
+        sa.column('email_normalized', sa.String),
+        sa.column('phone_normalized', sa.String),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(candidates.c.id, candidates.c.email, candidates.c.phone)
+            .where(candidates.c.id > last_id)
+            .order_by(candidates.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            candidates.update()
+            .where(candidates.c.id == sa.bindparam('row_id'))
+            .values(email_normalized=sa.bindparam('email_value'), phone_normalized=sa.bindparam('phone_value')),
+            [
+                {'row_id': row.id, 'email_value': normalize_email(row.email), 'phone_value': normalize_phone(row.phone)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.create_index(op.f('ix_candidates_email_normalized'), 'candidates', ['email_normalized'], unique=False)
+    op.create_index(op.f('ix_candidates_phone_normalized'), 'candidates', ['phone_normalized'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_candidates_phone_normalized'), table_name='candidates')
+    op.drop_index(op.f('ix_candidates_email_normalized'), table_name='candidates')
+    op.drop_column('candidates', 'phone_normalized')
+    op.drop_column('candidates', 'email_normalized')
@@ -0,0 +1,70 @@
+"""add trigram-indexed search_text to candidates
+
+Revision ID: 8d4b2f7e1a60
+Revises: 3f8e1c6b9a27
+Create Date: 2026-10-17 18:02:37.640251
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.utils.normalization import candidate_search_text
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4b2f7e1a60'
+down_revision = '3f8e1c6b9a27'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('candidates', sa.Column('search_text', sa.Text(), nullable=True))
+
+    # Backfill with the same flattening the app uses on write
+    bind = op.get_bind()
+    candidates = sa.table(
+        'candidates',
+        sa.column('id', sa.Integer),
+        sa.column('skills', sa.JSON),
+        sa.column('designations', sa.JSON),
+        sa.column('search_text', sa.Text),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(candidates.c.id, candidates.c.skills, candidates.c.designations)
+            .where(candidates.c.id > last_id)
+            .order_by(candidates.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            candidates.update()
+            .where(candidates.c.id == sa.bindparam('row_id'))
+            .values(search_text=sa.bindparam('search_text_value')),
+            [
+                {
+                    'row_id': row.id,
+                    'search_text_value': candidate_search_text(
+                        row.skills if isinstance(row.skills, list) else None,
+                        row.designations if isinstance(row.designations, list) else None,
+                    ),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.create_index(
+        'ix_candidates_search_text_trgm', 'candidates', ['search_text'],
+        unique=False, postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidates_search_text_trgm', table_name='candidates')
+    op.drop_column('candidates', 'search_text')
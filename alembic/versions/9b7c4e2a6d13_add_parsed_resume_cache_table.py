@@ -0,0 +1,41 @@
+"""add parsed_resume_cache table
+
+Revision ID: 9b7c4e2a6d13
+Revises: 5d2e8b1c9f47
+Create Date: 2026-10-17 10:03:27.552918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b7c4e2a6d13'
+down_revision = '5d2e8b1c9f47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'parsed_resume_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(), nullable=False),
+        sa.Column('prompt_version', sa.String(), nullable=False),
+        sa.Column('parsed_data', sa.JSON(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('last_hit_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_parsed_resume_cache_id'), 'parsed_resume_cache', ['id'], unique=False)
+    op.create_index(op.f('ix_parsed_resume_cache_cache_key'), 'parsed_resume_cache', ['cache_key'], unique=True)
+    op.create_index(op.f('ix_parsed_resume_cache_created_at'), 'parsed_resume_cache', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_parsed_resume_cache_created_at'), table_name='parsed_resume_cache')
+    op.drop_index(op.f('ix_parsed_resume_cache_cache_key'), table_name='parsed_resume_cache')
+    op.drop_index(op.f('ix_parsed_resume_cache_id'), table_name='parsed_resume_cache')
+    op.drop_table('parsed_resume_cache')
@@ -0,0 +1,51 @@
+"""add weighted full-text search_vector to candidates
+
+Revision ID: a2c7e9f4b815
+Revises: 8d4b2f7e1a60
+Create Date: 2026-10-17 19:26:14.208773
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2c7e9f4b815'
+down_revision = '8d4b2f7e1a60'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Same weights as app.models.candidate.search_vector_expression, with the default FULL_TEXT_SEARCH_CONFIG
+BACKFILL_SQL = """
+UPDATE candidates SET search_vector =
+    setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(value, ' ') FROM json_array_elements_text(
+            CASE WHEN json_typeof(skills) = 'array' THEN skills ELSE '[]'::json END)
+    ), '')), 'A')
+    || setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(value, ' ') FROM json_array_elements_text(
+            CASE WHEN json_typeof(designations) = 'array' THEN designations ELSE '[]'::json END)
+    ), '')), 'B')
+    || setweight(to_tsvector('english', coalesce(domain_knowledge, '')), 'C')
+WHERE id > :start_id AND id <= :end_id
+"""
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Backfill in id ranges so no single statement rewrites the whole table
+    bind = op.get_bind()
+    max_id = bind.execute(sa.text("SELECT coalesce(max(id), 0) FROM candidates")).scalar()
+    for start_id in range(0, max_id, BACKFILL_BATCH_SIZE):
+        bind.execute(sa.text(BACKFILL_SQL), {'start_id': start_id, 'end_id': start_id + BACKFILL_BATCH_SIZE})
+
+    op.create_index('ix_candidates_search_vector', 'candidates', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidates_search_vector', table_name='candidates')
+    op.drop_column('candidates', 'search_vector')
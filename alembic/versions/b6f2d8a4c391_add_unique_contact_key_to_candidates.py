@@ -0,0 +1,43 @@
+"""add unique contact_key to candidates
+
+Revision ID: b6f2d8a4c391
+Revises: 7c3a9d5e2f18
+Create Date: 2026-10-17 15:31:08.904417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6f2d8a4c391'
+down_revision = '7c3a9d5e2f18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('contact_key', sa.String(), nullable=True))
+    op.execute("UPDATE candidates SET contact_key = COALESCE(email_normalized, phone_normalized)")
+
+    # Existing duplicates: only the most recently updated row keeps the key
+    op.execute(
+        """
+        UPDATE candidates SET contact_key = NULL
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY contact_key ORDER BY updated_at DESC NULLS LAST, id DESC
+            ) AS rank
+            FROM candidates
+            WHERE contact_key IS NOT NULL
+        ) ranked
+        WHERE candidates.id = ranked.id AND ranked.rank > 1
+        """
+    )
+
+    op.create_index(op.f('ix_candidates_contact_key'), 'candidates', ['contact_key'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_candidates_contact_key'), table_name='candidates')
+    op.drop_column('candidates', 'contact_key')
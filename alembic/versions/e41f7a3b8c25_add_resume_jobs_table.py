@@ -0,0 +1,52 @@
+"""add resume_jobs table
+
+Revision ID: e41f7a3b8c25
+Revises: 9b7c4e2a6d13
+Create Date: 2026-10-17 11:20:05.874113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e41f7a3b8c25'
+down_revision = '9b7c4e2a6d13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'resume_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column(
+            'status',
+            sa.Enum('queued', 'processing', 'completed', 'failed', name='resumejobstatus'),
+            nullable=False,
+        ),
+        sa.Column('filename', sa.String(), nullable=False),
+        sa.Column('file_path', sa.String(), nullable=False),
+        sa.Column('file_size', sa.Integer(), nullable=False),
+        sa.Column('file_hash', sa.String(length=64), nullable=True),
+        sa.Column('celery_task_id', sa.String(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('candidate_id', sa.Integer(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('uploaded_by', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['uploaded_by'], ['users.id']),
+    )
+    op.create_index(op.f('ix_resume_jobs_id'), 'resume_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_resume_jobs_uploaded_by'), 'resume_jobs', ['uploaded_by'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resume_jobs_uploaded_by'), table_name='resume_jobs')
+    op.drop_index(op.f('ix_resume_jobs_id'), table_name='resume_jobs')
+    op.drop_table('resume_jobs')
+    op.execute("DROP TYPE IF EXISTS resumejobstatus")
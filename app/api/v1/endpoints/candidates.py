@@ -1,62 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, and_, func, cast, String
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
 from datetime import datetime
-from pathlib import Path
+import asyncio
 import os
 from app.db.base import get_db
-from app.schemas.candidate import Candidate as CandidateSchema, ParsedCandidateData, CandidateUpdate
+from app.schemas.candidate import (
+    Candidate as CandidateSchema,
+    CandidateFields,
+    ParsedCandidateData,
+    CandidateUpdate,
+    BulkUploadResponse,
+    CandidateSnapshot,
+    CandidateBulkUpdate,
+    CandidateBulkUpdateResponse,
+)
 from app.models.candidate import Candidate, CandidateStatus
 from app.models.candidate_note import CandidateNote
+from app.models.resume_job import ResumeJob, ResumeJobStatus
+from app.schemas.resume_job import ResumeJob as ResumeJobSchema
 from app.models.user import User
-from app.core.deps import get_current_user, require_recruiter_or_above
-from app.utils.file_handler import save_upload_file, extract_text_from_file, delete_file
-from app.services.candidate_service import process_candidate_resume
+from app.core.deps import get_current_user, require_recruiter_or_above, require_admin
+from app.utils.file_handler import (
+    save_upload_file,
+    save_upload_archive,
+    extract_archive_members,
+    extract_text_from_file,
+    delete_file,
+)
+from app.services.candidate_service import (
+    process_candidate_resume,
+    process_candidate_resumes_bulk,
+    sync_candidate_terms,
+    update_candidate_statuses,
+)
+from app.services.candidate_search import skill_search_condition, full_text_search
+from app.services.boolean_query import boolean_query_condition, normalized_query, BooleanQueryError
+from app.services.skill_index import skill_index
+from app.services.candidate_export import EXPORT_FORMATS, stream_ndjson, stream_csv
+from app.services.candidate_snapshot import write_snapshot, latest_watermark
+from app.utils.normalization import normalize_email
+from app.utils.pagination import created_at_keyset, decode_created_at_cursor, decode_rank_cursor, finish_page
+from app.utils.projection import parse_fields, candidate_columns, render_candidates
+from app.services.celery_app import celery_app
+from app.core.config import settings
 import logging
-import re
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-def parse_boolean_search(search_query: str):
-    """
-    Parse boolean search query and return AND/OR groups.
-
-    Examples:
-        "Ruby and Python" -> [["Ruby", "Python"]] (AND group)
-        "Ruby or Python" -> [["Ruby"], ["Python"]] (OR groups)
-        "Ruby and Python or Java" -> [["Ruby", "Python"], ["Java"]] (AND group OR single term)
-        "(Python and React) or Ruby" -> [["Python", "React"], ["Ruby"]] (grouped AND OR single term)
-
-    Returns:
-        List of lists where each inner list represents skills that must ALL be present (AND),
-        and the outer list represents alternatives (OR).
-    """
-    # Normalize the query - remove extra spaces and strip
-    query = search_query.strip()
-
-    # Remove parentheses - they're just for visual grouping
-    query = query.replace('(', '').replace(')', '')
-
-    # Split by 'or' (case-insensitive) to get OR groups
-    or_groups = re.split(r'\s+or\s+', query, flags=re.IGNORECASE)
-
-    result = []
-    for group in or_groups:
-        # Split each OR group by 'and' to get AND terms
-        and_terms = re.split(r'\s+and\s+', group, flags=re.IGNORECASE)
-        # Clean and filter empty terms
-        and_terms = [term.strip() for term in and_terms if term.strip()]
-        if and_terms:
-            result.append(and_terms)
-
-    return result
-
-
 @router.post("/upload", status_code=status.HTTP_201_CREATED, response_model=CandidateSchema)
 async def upload_candidate_resume(
     file: UploadFile = File(...),
@@ -70,7 +67,7 @@ async def upload_candidate_resume(
     """
     try:
         # Save file
-        file_path, file_size = await save_upload_file(file)
+        file_path, file_size, file_hash = await save_upload_file(file)
 
         # Process resume synchronously
         candidate = await process_candidate_resume(
@@ -79,10 +76,13 @@ async def upload_candidate_resume(
             filename=file.filename,
             file_size=file_size,
             uploaded_by=current_user.id,
+            file_hash=file_hash,
         )
 
         return candidate
 
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.error(f"Error processing candidate resume: {e}")
         raise HTTPException(
@@ -97,78 +97,398 @@ async def upload_candidate_resume(
         )
 
 
-@router.get("/", response_model=List[CandidateSchema])
+@router.post("/upload/bulk", response_model=BulkUploadResponse)
+async def upload_candidate_resumes_bulk(
+    files: List[UploadFile] = File(...),
+    current_user: User = Depends(require_recruiter_or_above),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Upload many resume files and/or ZIP archives of resumes in one request.
+    Resumes are extracted and parsed concurrently and saved in batches.
+    Returns a per-file result manifest. Requires Recruiter role or higher.
+    """
+    saved = []
+    rejected = []
+    too_many = f"Upload exceeds maximum of {settings.BULK_UPLOAD_MAX_FILES} files"
+
+    try:
+        # Stop writing files to disk once BULK_UPLOAD_MAX_FILES resumes are saved
+        for upload in files:
+            remaining = settings.BULK_UPLOAD_MAX_FILES - len(saved)
+            if remaining <= 0:
+                rejected.append((upload.filename, too_many))
+                continue
+            if upload.filename.lower().endswith(".zip"):
+                try:
+                    archive_path = await save_upload_archive(upload)
+                except HTTPException as e:
+                    rejected.append((upload.filename, e.detail))
+                    continue
+                try:
+                    members, skipped = await asyncio.to_thread(extract_archive_members, archive_path, remaining)
+                except HTTPException as e:
+                    rejected.append((upload.filename, e.detail))
+                    continue
+                finally:
+                    await delete_file(archive_path)
+                saved.extend(members)
+                rejected.extend(skipped)
+            else:
+                try:
+                    file_path, file_size, file_hash = await save_upload_file(upload)
+                except HTTPException as e:
+                    rejected.append((upload.filename, e.detail))
+                    continue
+                saved.append((upload.filename, file_path, file_size, file_hash))
+    except BaseException:
+        for _, file_path, _, _ in saved:
+            await delete_file(file_path)
+        raise
+
+    # Removes the files of every resume it does not store, also when it fails
+    results = await process_candidate_resumes_bulk(db, saved, uploaded_by=current_user.id)
+    results.extend(
+        {"filename": filename, "status": "failed", "candidate_id": None, "error": reason}
+        for filename, reason in rejected
+    )
+
+    return {
+        "total": len(results),
+        "created": sum(1 for r in results if r["status"] == "created"),
+        "updated": sum(1 for r in results if r["status"] == "updated"),
+        "duplicates": sum(1 for r in results if r["status"] == "duplicate"),
+        "failed": sum(1 for r in results if r["status"] == "failed"),
+        "results": results,
+    }
+
+
+@router.post("/upload/async", status_code=status.HTTP_202_ACCEPTED, response_model=ResumeJobSchema)
+async def upload_candidate_resume_async(
+    file: UploadFile = File(...),
+    current_user: User = Depends(require_recruiter_or_above),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Upload a candidate's resume file for background processing.
+    The file is saved and queued; poll the returned job via GET /candidates/jobs/{job_id}.
+    Requires Recruiter role or higher.
+    """
+    if not settings.CELERY_BROKER_URL:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Background processing is not configured",
+        )
+
+    file_path, file_size, file_hash = await save_upload_file(file)
+
+    job = ResumeJob(
+        status=ResumeJobStatus.QUEUED,
+        filename=file.filename,
+        file_path=file_path,
+        file_size=file_size,
+        file_hash=file_hash,
+        uploaded_by=current_user.id,
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+
+    try:
+        # Enqueue by name so the API process does not need the worker's sync engine
+        task = celery_app.send_task(
+            "app.services.celery_tasks.process_candidate_resume_task",
+            kwargs={
+                "file_path": file_path,
+                "filename": file.filename,
+                "file_size": file_size,
+                "uploaded_by": current_user.id,
+                "file_hash": file_hash,
+                "job_id": job.id,
+            },
+        )
+    except Exception as e:
+        logger.error(f"Error queueing candidate resume {file.filename}: {e}")
+        job.status = ResumeJobStatus.FAILED
+        job.error_message = f"Could not queue job: {str(e)}"
+        await db.commit()
+        await delete_file(file_path)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not queue candidate resume for processing",
+        )
+
+    job.celery_task_id = task.id
+    await db.commit()
+    await db.refresh(job)
+
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=ResumeJobSchema)
+async def get_resume_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get the state, timings and resulting candidate of a background resume job"""
+    result = await db.execute(select(ResumeJob).where(ResumeJob.id == job_id))
+    job = result.scalar_one_or_none()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+
+    return job
+
+
+@router.get("/", response_model=List[CandidateFields])
 async def list_candidates(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (ignored with cursor)"),
+    limit: int = Query(100, ge=1, le=settings.CANDIDATE_PAGE_MAX_LIMIT, description="Maximum number of records to return"),
     status_filter: Optional[CandidateStatus] = None,
     skills: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,skills"),
+    view: str = Query("full", description="full or summary (slim rows for grid views)"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    List all candidates with optional filters.
+    List all candidates with optional filters, newest first.
 
     Args:
-        skip: Number of records to skip (for pagination)
-        limit: Maximum number of records to return
+        cursor: Opaque cursor for the next page, from the X-Next-Cursor response header.
+                Prefer it over skip: every page costs the same however deep it is.
+        skip: Number of records to skip (legacy offset pagination)
+        limit: Maximum number of records to return (at most CANDIDATE_PAGE_MAX_LIMIT)
         status_filter: Filter by candidate status
-        skills: Boolean search query for skills OR designations (e.g., "Ruby and Python", "Java or Python", "Ruby and Python or Java")
+        skills: Boolean search query for skills OR designations (e.g., "Ruby and Python", "(Python or Go) and Kubernetes")
                 - Searches in both skills and designations fields
-                - Use "and" to require all terms to be present
+                - Use "and" to require all terms to be present ("and" binds tighter than "or")
                 - Use "or" to match any of the alternatives
+                - Use "not" to exclude a term and parentheses to group
+                - Quote multi-word phrases that contain and/or/not (e.g., "research and development")
                 - Supports partial matching (e.g., "Ruby" matches "Ruby on Rails")
+                - With SKILL_INDEX_ENABLED the search runs in memory and results are newest id first.
+                  Candidates written by Celery workers or other API processes only match once
+                  the index refreshes (every SKILL_INDEX_REFRESH_SECONDS); deleted ones are
+                  dropped from results immediately
+        fields: Sparse fieldset; only these fields are loaded and returned
+        view: "summary" returns CandidateSummary rows (ignored when fields is given)
+
+    Rows are serialized straight from the selected columns with orjson.
     """
-    # Start with base query
-    query = select(Candidate)
+    field_names = parse_fields(fields, view)
+
+    # Start with base query, selecting only the columns the response needs
+    query = select(*candidate_columns(field_names))
 
     # Apply filters FIRST
     if status_filter:
         query = query.where(Candidate.status == status_filter)
 
     if skills:
-        # Parse the boolean search query
-        or_groups = parse_boolean_search(skills)
-
-        # Build the SQL conditions
-        # Each OR group is a list of AND terms
-        # Example: [["Ruby", "Python"], ["Java"]] means (Ruby AND Python) OR (Java)
-        # Each term searches in both skills AND designations fields
-        if or_groups:
-            or_conditions = []
-
-            for and_terms in or_groups:
-                if len(and_terms) == 1:
-                    # Single term, search in both skills OR designations
-                    term = and_terms[0]
-                    or_conditions.append(
-                        or_(
-                            func.lower(cast(Candidate.skills, String)).like(f'%{term.lower()}%'),
-                            func.lower(cast(Candidate.designations, String)).like(f'%{term.lower()}%')
-                        )
-                    )
-                else:
-                    # Multiple terms with AND - all must be present (in either skills or designations)
-                    and_conditions = []
-                    for term in and_terms:
-                        and_conditions.append(
-                            or_(
-                                func.lower(cast(Candidate.skills, String)).like(f'%{term.lower()}%'),
-                                func.lower(cast(Candidate.designations, String)).like(f'%{term.lower()}%')
-                            )
-                        )
-                    # Combine with AND
-                    or_conditions.append(and_(*and_conditions))
-
-            # Combine all OR groups with OR
-            query = query.where(or_(*or_conditions))
+        # Each term matches skills or designations; parsed plans are cached
+        try:
+            if settings.SKILL_INDEX_ENABLED and skill_index.ready:
+                node = normalized_query(skills)
+                if node is not None:
+                    # Evaluate in memory; the database only loads one page of ids
+                    before_id = decode_created_at_cursor(cursor)[1] if cursor else None
+                    offset = 0 if cursor else skip
+                    rows = []
+                    while len(rows) <= limit:
+                        wanted = limit + 1 - len(rows)
+                        _, page_ids = skill_index.search(node, status_filter, offset, wanted, before_id=before_id)
+                        result = await db.execute(query.where(Candidate.id.in_(page_ids)))
+                        by_id = {row.id: row for row in result.all()}
+                        rows.extend(by_id[candidate_id] for candidate_id in page_ids if candidate_id in by_id)
+                        if len(page_ids) < wanted:
+                            break
+                        # Ids deleted or changed by another process since the last refresh
+                        # left the page short; keep reading below them
+                        before_id, offset = page_ids[-1], 0
+                    rows = finish_page(response, rows, limit, lambda row: (row.created_at, row.id))
+                    return render_candidates(response, rows, field_names)
+            condition = boolean_query_condition(skills)
+        except BooleanQueryError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        if condition is not None:
+            query = query.where(condition)
 
     # Apply ordering, then pagination LAST
-    query = query.order_by(Candidate.created_at.desc()).offset(skip).limit(limit)
+    query = created_at_keyset(query, cursor, limit)
+    if skip and not cursor:
+        query = query.offset(skip)
 
     result = await db.execute(query)
-    candidates = result.scalars().all()
-    return candidates
+    rows = finish_page(response, result.all(), limit, lambda row: (row.created_at, row.id))
+    return render_candidates(response, rows, field_names)
+
+
+@router.get("/search", response_model=List[CandidateFields])
+async def search_candidates(
+    response: Response,
+    q: str,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    limit: int = Query(20, ge=1, le=settings.SEARCH_MAX_LIMIT, description="Maximum number of records to return"),
+    status_filter: Optional[CandidateStatus] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,skills"),
+    view: str = Query("full", description="full or summary (slim rows for grid views)"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Full-text search over skills, designations and domain knowledge, best matches first.
+
+    Args:
+        q: Search text, e.g. "python django", "\"machine learning\"" or "java -android"
+        cursor: Opaque cursor for the next page, from the X-Next-Cursor response header
+        limit: Maximum number of records to return (at most SEARCH_MAX_LIMIT)
+        status_filter: Filter by candidate status
+        fields: Sparse fieldset; only these fields are loaded and returned
+        view: "summary" returns CandidateSummary rows (ignored when fields is given)
+
+    Skill matches rank above designation matches, which rank above domain knowledge matches.
+    """
+    field_names = parse_fields(fields, view)
+    condition, rank = full_text_search(q)
+    query = (
+        select(*candidate_columns(field_names), rank.label("rank"))
+        .where(condition)
+    )
+
+    if status_filter:
+        query = query.where(Candidate.status == status_filter)
+
+    if cursor:
+        last_rank, last_id = decode_rank_cursor(cursor)
+        query = query.where(tuple_(rank, Candidate.id) < tuple_(last_rank, last_id))
+    query = query.order_by(rank.desc(), Candidate.id.desc()).limit(limit + 1)
+
+    result = await db.execute(query)
+    rows = finish_page(response, result.all(), limit, lambda row: (row.rank, row.id))
+    return render_candidates(response, rows, field_names)
+
+
+@router.get("/export")
+async def export_candidates(
+    format: str = Query("ndjson", description="ndjson or csv"),
+    status_filter: Optional[CandidateStatus] = None,
+    skills: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to export, e.g. id,name,skills"),
+    view: str = Query("full", description="full or summary"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream every matching candidate as NDJSON or CSV, oldest first.
+
+    Accepts the same status_filter, skills (boolean query), fields and view parameters
+    as the list endpoint. Rows come from a server-side cursor inside a single snapshot
+    transaction, so memory stays flat and the export is consistent under concurrent writes.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown format '{format}'. Allowed formats: {', '.join(EXPORT_FORMATS)}",
+        )
+    field_names = parse_fields(fields, view)
+
+    query = select(*candidate_columns(field_names))
+    if status_filter:
+        query = query.where(Candidate.status == status_filter)
+    if skills:
+        try:
+            condition = boolean_query_condition(skills)
+        except BooleanQueryError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        if condition is not None:
+            query = query.where(condition)
+    query = query.order_by(Candidate.id)
+
+    stream = stream_csv if format == "csv" else stream_ndjson
+    filename = f"candidates_{datetime.utcnow():%Y%m%d_%H%M%S}.{format}"
+    return StreamingResponse(
+        stream(query, field_names),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/snapshot", status_code=status.HTTP_201_CREATED, response_model=CandidateSnapshot)
+async def create_candidate_snapshot(
+    format: str = Query("parquet", description="parquet or arrow"),
+    incremental: bool = Query(False, description="Only candidates updated since the latest snapshot"),
+    current_user: User = Depends(require_admin),
+):
+    """
+    Write a columnar snapshot of candidates to SNAPSHOT_DIR for analytics (Admin only).
+
+    Skills and designations are list columns and status is dictionary-encoded. With
+    incremental, only candidates updated since the watermark of the newest snapshot
+    are written; without a previous snapshot a full one is taken.
+    """
+    since = await asyncio.to_thread(latest_watermark) if incremental else None
+    try:
+        return await write_snapshot(format, since=since)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.patch("/bulk", response_model=CandidateBulkUpdateResponse)
+async def bulk_update_candidate_status(
+    bulk_update: CandidateBulkUpdate,
+    current_user: User = Depends(require_recruiter_or_above),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Move many candidates to one status at once. Requires Recruiter role or higher.
+
+    Runs one UPDATE for all ids and, when a note is given, one insert recording the
+    previous and new status of each candidate. Ids that do not exist are returned
+    in not_found.
+    """
+    candidate_ids = list(dict.fromkeys(bulk_update.ids))
+    if not candidate_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No candidate ids given",
+        )
+    if len(candidate_ids) > settings.BULK_STATUS_UPDATE_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BULK_STATUS_UPDATE_MAX_IDS} candidates can be updated at once",
+        )
+
+    rows = await update_candidate_statuses(
+        db, candidate_ids, bulk_update.status, current_user.id, bulk_update.note
+    )
+    await db.commit()
+
+    for row in rows:
+        skill_index.update_status(row.id, row.new_status)
+
+    updated_ids = {row.id for row in rows}
+    return {
+        "updated": [
+            {"id": row.id, "previous_status": row.previous_status, "new_status": row.new_status}
+            for row in rows
+        ],
+        "not_found": [candidate_id for candidate_id in candidate_ids if candidate_id not in updated_ids],
+    }
 
 
 @router.get("/{candidate_id}", response_model=CandidateSchema)
@@ -255,6 +575,9 @@ async def update_candidate(
 
     candidate.updated_at = datetime.utcnow()
 
+    if "skills" in update_data or "designations" in update_data:
+        await sync_candidate_terms(db, candidate)
+
     # If a note is provided, create a note entry
     if note_text:
         note = CandidateNote(
@@ -266,8 +589,16 @@ async def update_candidate(
         )
         db.add(note)
 
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Another candidate already has this email or phone",
+        )
     await db.refresh(candidate)
+    skill_index.update_candidate(candidate)
 
     return candidate
 
@@ -293,24 +624,33 @@ async def delete_candidate(
 
     # Delete from database
     await db.delete(candidate)
+    # Only drop it from the index once the delete is committed
+    await db.commit()
+    skill_index.remove_candidate(candidate_id)
 
     return None
 
 
-@router.get("/search/by-skill", response_model=List[CandidateSchema])
+@router.get("/search/by-skill", response_model=List[CandidateFields])
 async def search_candidates_by_skill(
+    response: Response,
     skill: str,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    limit: int = Query(100, ge=1, le=settings.CANDIDATE_PAGE_MAX_LIMIT, description="Maximum number of records to return"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,name,skills"),
+    view: str = Query("full", description="full or summary (slim rows for grid views)"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Search candidates by skill using case-insensitive partial matching"""
-    result = await db.execute(
-        select(Candidate)
-        .where(func.lower(func.cast(Candidate.skills, String)).like(f'%{skill.lower()}%'))
-        .order_by(Candidate.created_at.desc())
+    """Search candidates by skill using case-insensitive partial matching, newest first"""
+    field_names = parse_fields(fields, view)
+    query = (
+        select(*candidate_columns(field_names))
+        .where(skill_search_condition(skill))
     )
-    candidates = result.scalars().all()
-    return candidates
+    result = await db.execute(created_at_keyset(query, cursor, limit))
+    rows = finish_page(response, result.all(), limit, lambda row: (row.created_at, row.id))
+    return render_candidates(response, rows, field_names)
 
 
 @router.get("/search/by-email", response_model=CandidateSchema)
@@ -322,8 +662,9 @@ async def search_candidate_by_email(
     """Search candidate by email"""
     result = await db.execute(
         select(Candidate)
-        .where(Candidate.email == email)
+        .where(Candidate.email_normalized == normalize_email(email))
         .order_by(Candidate.created_at.desc())
+        .limit(1)
     )
     candidate = result.scalar_one_or_none()
 
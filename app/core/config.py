@@ -1,5 +1,6 @@
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Literal
 import secrets
 
 
@@ -27,12 +28,70 @@ class Settings(BaseSettings):
 
     # OpenAI
     OPENAI_API_KEY: str
+    OPENAI_MODEL: str = "gpt-4o-mini"
+    PARSE_PROMPT_VERSION: str = "3"  # Bump whenever the parsing prompt changes
+    OPENAI_REQUESTS_PER_MINUTE: int = 500
+    OPENAI_TOKENS_PER_MINUTE: int = 200000
+    OPENAI_RATE_LIMIT_RETRIES: int = 3  # Local retries of a 429 before giving up
+    OPENAI_RESPONSE_FORMAT: Literal["json_schema", "json_object", "text"] = "json_schema"
+    RESUME_TOKEN_BUDGET: int = 6000  # Max resume tokens sent in a single parsing prompt
+    RESUME_CHUNKED_PARSING: bool = True  # Parse longer resumes in concurrent chunks
+    RESUME_CHUNK_TOKENS: int = 3000
+    RESUME_MAX_CHUNKS: int = 8
+
+    # Local resume pre-classifier (runs before any OpenAI call)
+    RESUME_CLASSIFIER_ENABLED: bool = True
+    RESUME_CLASSIFIER_REJECT_SCORE: float = -2.0  # At or below: rejected without calling OpenAI
+    RESUME_CLASSIFIER_ACCEPT_SCORE: float = 4.0  # At or above: clearly a resume
+
+    # Contact normalization
+    DEFAULT_PHONE_REGION: str = "US"  # Region assumed for phone numbers without a country code
+
+    # Pagination
+    CANDIDATE_PAGE_MAX_LIMIT: int = 500  # Largest page size for candidate list endpoints
+    GZIP_MINIMUM_SIZE: int = 1024  # Responses smaller than this are sent uncompressed
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per server-side cursor round trip in exports
+
+    # Columnar snapshots for analytics
+    SNAPSHOT_DIR: str = "snapshots"
+    SNAPSHOT_ROW_GROUP_SIZE: int = 65536  # Rows per Parquet row group / Arrow record batch
+
+    # Full-text search
+    FULL_TEXT_SEARCH_CONFIG: str = "english"  # Text search configuration; changing it needs a search_vector rebuild
+    SEARCH_MAX_LIMIT: int = 100  # Largest page size for GET /candidates/search
+    SEARCH_PLAN_CACHE_SIZE: int = 512  # Parsed/compiled boolean skill queries kept in memory
+    SKILL_INDEX_ENABLED: bool = False  # Serve boolean skill filters from an in-process inverted index
+    SKILL_INDEX_REFRESH_SECONDS: int = 30  # How often writes from other processes are picked up
+    SKILL_INDEX_RECONCILE_SECONDS: int = 300  # How often deletes from other processes are picked up
+
+    # Re-uploads of known candidates (matched by locally extracted email/phone)
+    KNOWN_CANDIDATE_REPARSE_POLICY: Literal["always", "skip_if_recent", "defer_if_recent"] = "always"
+    KNOWN_CANDIDATE_RECENT_DAYS: int = 30
+
+    # Parse result cache
+    PARSE_CACHE_ENABLED: bool = True
+    PARSE_CACHE_MAX_ENTRIES: int = 1024  # In-process LRU size
+    PARSE_CACHE_TTL_SECONDS: int = 2592000  # 30 days
 
     # File Upload
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
+    UPLOAD_CHUNK_SIZE: int = 65536  # 64KB read/write chunk for streaming uploads
     ALLOWED_EXTENSIONS: str = "pdf,doc,docx"
     UPLOAD_DIR: str = "uploads"
 
+    # Bulk upload
+    MAX_ARCHIVE_SIZE: int = 524288000  # 500MB
+    BULK_UPLOAD_MAX_FILES: int = 1000
+    BULK_UPLOAD_CONCURRENCY: int = 8  # Resumes extracted and parsed at the same time
+    BULK_COMMIT_BATCH_SIZE: int = 50  # Candidates written per transaction
+    BULK_STATUS_UPDATE_MAX_IDS: int = 1000  # Candidates per PATCH /candidates/bulk
+
+    # Text extraction
+    EXTRACTION_POOL_WORKERS: int = 2  # 0 runs extraction in a thread instead of a process pool
+    EXTRACTION_MAX_TASKS_PER_CHILD: int = 50  # Recycle worker processes after this many jobs
+    EXTRACTION_TIMEOUT_SECONDS: int = 60
+    EXTRACTION_MAX_PAGES: int = 50
+
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000"]
 
@@ -40,6 +99,13 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
+    @model_validator(mode="after")
+    def check_reparse_policy(self):
+        # Deferred re-parsing is queued to Celery; without a broker there is nowhere to send it
+        if self.KNOWN_CANDIDATE_REPARSE_POLICY == "defer_if_recent" and not self.CELERY_BROKER_URL:
+            raise ValueError("KNOWN_CANDIDATE_REPARSE_POLICY=defer_if_recent requires CELERY_BROKER_URL")
+        return self
+
     @property
     def allowed_extensions_list(self) -> List[str]:
         return [ext.strip() for ext in self.ALLOWED_EXTENSIONS.split(",")]
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.core.config import settings
@@ -11,6 +12,11 @@ from app.core.middleware import (
     request_logging_middleware,
 )
 from app.api.v1.router import api_router
+from app.utils.file_handler import shutdown_extraction_pool
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.db.base import async_session_maker
+from app.services.skill_index import run_skill_index_refresher
+import asyncio
 import logging
 
 # Setup logging
@@ -33,8 +39,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the cursor for the next page
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Compress large responses for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
+
 # Request logging middleware
 app.middleware("http")(request_logging_middleware)
 
@@ -67,9 +78,15 @@ async def health_check():
 async def startup_event():
     """Application startup"""
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
+    if settings.SKILL_INDEX_ENABLED:
+        app.state.skill_index_task = asyncio.create_task(run_skill_index_refresher(async_session_maker))
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown"""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    skill_index_task = getattr(app.state, "skill_index_task", None)
+    if skill_index_task:
+        skill_index_task.cancel()
+    shutdown_extraction_pool()
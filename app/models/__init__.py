@@ -1,6 +1,9 @@
 from app.models.user import User
 from app.models.candidate import Candidate
 from app.models.candidate_note import CandidateNote
+from app.models.candidate_term import CandidateSkill, CandidateDesignation
+from app.models.parse_cache import ParsedResumeCache
+from app.models.resume_job import ResumeJob
 from app.db.base import Base
 
-__all__ = ["User", "Candidate", "CandidateNote", "Base"]
+__all__ = ["User", "Candidate", "CandidateNote", "CandidateSkill", "CandidateDesignation", "ParsedResumeCache", "ResumeJob", "Base"]
@@ -1,7 +1,10 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text, Index, Enum as SQLEnum, cast, literal, literal_column
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
+from sqlalchemy.orm import relationship, validates, deferred
 from sqlalchemy.sql import func
+from app.core.config import settings
 from app.db.base import Base
+from app.utils.normalization import normalize_email, normalize_phone, candidate_contact_key, candidate_search_text
 import enum
 
 
@@ -18,6 +21,24 @@ class CandidateStatus(str, enum.Enum):
     REJECTED = "rejected"
 
 
+def search_vector_expression(skills: list[str] | None, designations: list[str] | None, domain_knowledge: str | None):
+    """
+    SQL expression for Candidate.search_vector: skills weighted A, designations B and
+    domain knowledge C, so ts_rank prefers skill matches.
+    """
+    config = cast(literal(settings.FULL_TEXT_SEARCH_CONFIG), REGCONFIG)
+    weighted_parts = (
+        (" ".join(str(term) for term in skills or []), "A"),
+        (" ".join(str(term) for term in designations or []), "B"),
+        (domain_knowledge or "", "C"),
+    )
+    vectors = [
+        func.setweight(func.to_tsvector(config, literal(text, Text)), literal_column(f"'{weight}'"))
+        for text, weight in weighted_parts
+    ]
+    return vectors[0].op("||")(vectors[1]).op("||")(vectors[2])
+
+
 class Candidate(Base):
     __tablename__ = "candidates"
 
@@ -25,6 +46,7 @@ class Candidate(Base):
     filename = Column(String, nullable=False)
     file_path = Column(String, nullable=False)
     file_size = Column(Integer, nullable=False)
+    file_hash = Column(String(64), nullable=True, unique=True, index=True)  # SHA-256 of file content
     status = Column(
         SQLEnum(CandidateStatus, values_callable=lambda x: [e.value for e in x]),
         default=CandidateStatus.UPLOADED,
@@ -35,10 +57,19 @@ class Candidate(Base):
     name = Column(String, nullable=True)
     email = Column(String, nullable=True, index=True)
     phone = Column(String, nullable=True)
+    # Normalized contact keys for dedup lookups, kept in sync with email/phone
+    email_normalized = Column(String, nullable=True, index=True)  # Lower-cased
+    phone_normalized = Column(String, nullable=True, index=True)  # E.164
+    contact_key = Column(String, nullable=True, unique=True, index=True)  # Uniqueness guard, see candidate_contact_key
     skills = Column(JSON, nullable=True)  # List of skills
     designations = Column(JSON, nullable=True)  # List of job titles/positions held
     domain_knowledge = Column(Text, nullable=True)
-    raw_parsed_data = Column(JSON, nullable=True)  # Full OpenAI response
+    # Lower-cased skills and designations, one per line, for trigram substring search
+    search_text = deferred(Column(Text, nullable=True))
+    # Weighted full-text vector over skills (A), designations (B) and domain knowledge (C)
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+    # Large columns never returned by the API are deferred: loaded only when accessed
+    raw_parsed_data = deferred(Column(JSON, nullable=True))  # Full OpenAI response
 
     # Metadata
     uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -50,3 +81,44 @@ class Candidate(Base):
     # Relationships
     uploaded_by_user = relationship("User", back_populates="candidates")
     notes = relationship("CandidateNote", back_populates="candidate", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index(
+            "ix_candidates_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index("ix_candidates_search_vector", "search_vector", postgresql_using="gin"),
+        # Keyset pagination newest first, see app.utils.pagination
+        Index("ix_candidates_created_at_id", "created_at", "id"),
+    )
+
+    @validates("email")
+    def _sync_email_normalized(self, key, value):
+        self.email_normalized = normalize_email(value)
+        self.contact_key = candidate_contact_key(self.email_normalized, self.phone_normalized)
+        return value
+
+    @validates("phone")
+    def _sync_phone_normalized(self, key, value):
+        self.phone_normalized = normalize_phone(value)
+        self.contact_key = candidate_contact_key(self.email_normalized, self.phone_normalized)
+        return value
+
+    @validates("skills")
+    def _sync_search_text_skills(self, key, value):
+        self.search_text = candidate_search_text(value, self.designations)
+        self.search_vector = search_vector_expression(value, self.designations, self.domain_knowledge)
+        return value
+
+    @validates("designations")
+    def _sync_search_text_designations(self, key, value):
+        self.search_text = candidate_search_text(self.skills, value)
+        self.search_vector = search_vector_expression(self.skills, value, self.domain_knowledge)
+        return value
+
+    @validates("domain_knowledge")
+    def _sync_search_vector_domain_knowledge(self, key, value):
+        self.search_vector = search_vector_expression(self.skills, self.designations, value)
+        return value
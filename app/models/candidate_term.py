@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, Text, ForeignKey, Index
+from app.db.base import Base
+
+
+class CandidateSkill(Base):
+    """One canonical (lower-cased) skill of a candidate, mirrored from Candidate.skills for indexed search"""
+
+    __tablename__ = "candidate_skills"
+
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+    term = Column(Text, primary_key=True)
+
+    # text_pattern_ops serves both equality and prefix LIKE 'term%' lookups
+    __table_args__ = (
+        Index("ix_candidate_skills_term", "term", postgresql_ops={"term": "text_pattern_ops"}),
+    )
+
+
+class CandidateDesignation(Base):
+    """One canonical (lower-cased) job title of a candidate, mirrored from Candidate.designations"""
+
+    __tablename__ = "candidate_designations"
+
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+    term = Column(Text, primary_key=True)
+
+    __table_args__ = (
+        Index("ix_candidate_designations_term", "term", postgresql_ops={"term": "text_pattern_ops"}),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class ParsedResumeCache(Base):
+    __tablename__ = "parsed_resume_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # SHA-256 of normalized resume text + prompt version + model name
+    cache_key = Column(String(64), unique=True, index=True, nullable=False)
+    model = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    parsed_data = Column(JSON, nullable=False)  # ParsedCandidateData dump
+    hit_count = Column(Integer, default=0, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    last_hit_at = Column(DateTime(timezone=True), nullable=True)
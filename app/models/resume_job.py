@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.db.base import Base
+import enum
+
+
+class ResumeJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ResumeJob(Base):
+    """Tracks a resume queued for background processing"""
+    __tablename__ = "resume_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(
+        SQLEnum(ResumeJobStatus, values_callable=lambda x: [e.value for e in x]),
+        default=ResumeJobStatus.QUEUED,
+        nullable=False,
+    )
+    filename = Column(String, nullable=False)
+    file_path = Column(String, nullable=False)
+    file_size = Column(Integer, nullable=False)
+    file_hash = Column(String(64), nullable=True)
+    celery_task_id = Column(String, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+
+    # Result
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="SET NULL"), nullable=True)
+    error_message = Column(Text, nullable=True)
+
+    # Metadata
+    uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    candidate = relationship("Candidate")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, computed_field
+from pydantic import BaseModel, EmailStr, computed_field, field_validator
 from typing import Optional, List
 from datetime import datetime
 from app.models.candidate import CandidateStatus
@@ -25,10 +25,29 @@ class CandidateUpdate(BaseModel):
     note: Optional[str] = None  # Optional note when updating (especially useful for status changes)
 
 
+class CandidateBulkUpdate(BaseModel):
+    ids: List[int]
+    status: CandidateStatus
+    note: Optional[str] = None  # Recorded on every moved candidate with its previous and new status
+
+
+class CandidateStatusChange(BaseModel):
+    id: int
+    previous_status: CandidateStatus
+    new_status: CandidateStatus
+
+
+class CandidateBulkUpdateResponse(BaseModel):
+    """Result of a bulk status update"""
+    updated: List[CandidateStatusChange]
+    not_found: List[int]
+
+
 class CandidateInDB(CandidateBase):
     id: int
     file_path: str
     file_size: int
+    file_hash: Optional[str] = None
     status: CandidateStatus
     name: Optional[str]
     email: Optional[str]
@@ -54,6 +73,46 @@ class Candidate(CandidateInDB):
         return f"/candidates/{self.id}/download"
 
 
+class CandidateSummary(BaseModel):
+    """Slim candidate row for list/grid views"""
+    id: int
+    status: CandidateStatus
+    name: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+    skills: Optional[List[str]]
+    designations: Optional[List[str]]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class CandidateFields(BaseModel):
+    """
+    Candidate row of a collection endpoint. Only the fields chosen with fields= or
+    view= are present: all of them by default, those of CandidateSummary with view=summary.
+    """
+    id: Optional[int] = None
+    filename: Optional[str] = None
+    file_path: Optional[str] = None
+    file_size: Optional[int] = None
+    file_hash: Optional[str] = None
+    status: Optional[CandidateStatus] = None
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    skills: Optional[List[str]] = None
+    designations: Optional[List[str]] = None
+    domain_knowledge: Optional[str] = None
+    uploaded_by: Optional[int] = None
+    error_message: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    processed_at: Optional[datetime] = None
+    download_url: Optional[str] = None
+
+
 class ParsedCandidateData(BaseModel):
     """Schema for parsed candidate data from resume via OpenAI"""
     name: Optional[str] = None
@@ -62,3 +121,48 @@ class ParsedCandidateData(BaseModel):
     skills: List[str] = []
     designations: List[str] = []
     domain_knowledge: Optional[str] = None
+
+
+class ResumeParseResult(ParsedCandidateData):
+    """Schema of the structured reply expected from the OpenAI resume parser"""
+    is_resume: bool
+    document_type: Optional[str] = None
+    error_reason: Optional[str] = None
+
+    @field_validator("skills", "designations", mode="before")
+    @classmethod
+    def coerce_list(cls, value):
+        """Accept null or a comma-separated string where a list is expected"""
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return value
+
+
+class BulkUploadFileResult(BaseModel):
+    """Per-file outcome of a bulk upload"""
+    filename: str
+    status: str  # created, updated, duplicate or failed
+    candidate_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkUploadResponse(BaseModel):
+    """Result manifest of a bulk upload"""
+    total: int
+    created: int
+    updated: int
+    duplicates: int
+    failed: int
+    results: List[BulkUploadFileResult]
+
+
+class CandidateSnapshot(BaseModel):
+    """A columnar snapshot file written for analytics"""
+    path: str
+    format: str
+    rows: int
+    watermark: datetime  # Start of the database snapshot; the next incremental export starts here
+    since: Optional[datetime] = None  # Set for incremental snapshots
+    size: int
@@ -0,0 +1,44 @@
+from pydantic import BaseModel, computed_field
+from typing import Optional
+from datetime import datetime
+from app.models.resume_job import ResumeJobStatus
+
+
+class ResumeJob(BaseModel):
+    """Schema for background resume processing job status"""
+    id: int
+    status: ResumeJobStatus
+    filename: str
+    file_size: int
+    attempts: int
+    candidate_id: Optional[int] = None
+    error_message: Optional[str] = None
+    uploaded_by: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+    @computed_field
+    @property
+    def status_url(self) -> str:
+        """URL to poll for job status"""
+        return f"/candidates/jobs/{self.id}"
+
+    @computed_field
+    @property
+    def queued_seconds(self) -> Optional[float]:
+        """Time spent waiting in the queue"""
+        if self.started_at is None:
+            return None
+        return (self.started_at - self.created_at).total_seconds()
+
+    @computed_field
+    @property
+    def processing_seconds(self) -> Optional[float]:
+        """Time spent processing once started"""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
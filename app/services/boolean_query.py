@@ -0,0 +1,243 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from sqlalchemy import and_, or_, not_, false, func
+from app.core.config import settings
+from app.services.candidate_search import term_condition
+from app.utils.normalization import normalize_term
+import re
+
+_TOKEN_RE = re.compile(r'\s*(?:(?P<paren>[()])|"(?P<phrase>[^"]*)"?|(?P<word>[^\s()"]+))')
+_OPERATORS = {"and", "or", "not"}
+
+
+class BooleanQueryError(ValueError):
+    """The search query is not a valid boolean expression"""
+
+
+@dataclass(frozen=True)
+class Term:
+    text: str
+
+
+@dataclass(frozen=True)
+class Not:
+    child: "Node"
+
+
+@dataclass(frozen=True)
+class And:
+    children: tuple
+
+
+@dataclass(frozen=True)
+class Or:
+    children: tuple
+
+
+Node = Term | Not | And | Or
+
+
+def tokenize(query: str) -> list[tuple[str, str]]:
+    """
+    Split a query into (kind, value) tokens: "(", ")", "and", "or", "not" and "term".
+    Consecutive bare words form one term ("Ruby on Rails"); quoted text is always
+    one term, even if it contains and/or/not.
+    """
+    tokens = []
+    words = []
+
+    def flush_words():
+        if words:
+            tokens.append(("term", " ".join(words)))
+            words.clear()
+
+    position = 0
+    query = query.rstrip()
+    while position < len(query):
+        match = _TOKEN_RE.match(query, position)
+        position = match.end()
+        if match.group("paren"):
+            flush_words()
+            tokens.append((match.group("paren"), match.group("paren")))
+        elif match.group("phrase") is not None:
+            flush_words()
+            tokens.append(("term", match.group("phrase")))
+        elif match.group("word").lower() in _OPERATORS:
+            flush_words()
+            tokens.append((match.group("word").lower(), match.group("word")))
+        else:
+            words.append(match.group("word"))
+    flush_words()
+    return tokens
+
+
+class _Parser:
+    """
+    Recursive-descent parser, lowest to highest precedence:
+        or_expr  := and_expr ("or" and_expr)*
+        and_expr := not_expr (["and"] not_expr)*
+        not_expr := "not" not_expr | "(" or_expr ")" | term
+    Adjacent operands without an operator, e.g. "(a or b) c", are ANDed.
+    """
+
+    def __init__(self, tokens: list[tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def _take(self) -> tuple[str, str]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def parse(self) -> Node:
+        node = self._or_expr()
+        if self._peek() is not None:
+            raise BooleanQueryError(f"Unexpected '{self.tokens[self.position][1]}' in search query")
+        return node
+
+    def _or_expr(self) -> Node:
+        children = [self._and_expr()]
+        while self._peek() == "or":
+            self._take()
+            children.append(self._and_expr())
+        return children[0] if len(children) == 1 else Or(tuple(children))
+
+    def _and_expr(self) -> Node:
+        children = [self._not_expr()]
+        while self._peek() in ("and", "not", "(", "term"):
+            if self._peek() == "and":
+                self._take()
+            children.append(self._not_expr())
+        return children[0] if len(children) == 1 else And(tuple(children))
+
+    def _not_expr(self) -> Node:
+        kind = self._peek()
+        if kind == "not":
+            self._take()
+            return Not(self._not_expr())
+        if kind == "(":
+            self._take()
+            node = self._or_expr()
+            if self._peek() != ")":
+                raise BooleanQueryError("Missing ')' in search query")
+            self._take()
+            return node
+        if kind == "term":
+            return Term(self._take()[1])
+        if kind is None:
+            raise BooleanQueryError("Search query ends where a term was expected")
+        raise BooleanQueryError(f"Unexpected '{self.tokens[self.position][1]}' in search query")
+
+
+def parse_query(query: str) -> Node | None:
+    """Parse a boolean search query into an AST; None for an empty query"""
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    return _Parser(tokens).parse()
+
+
+def _sort_key(node: Node) -> str:
+    return to_query_string(node)
+
+
+def normalize(node: Node | None) -> Node | None:
+    """
+    Canonicalize an AST: normalize term text, drop empty terms, remove double negation,
+    flatten nested AND/OR, de-duplicate and sort operands, and unwrap single operands.
+    Equivalent spellings ("go and python", "Python AND (Go)") normalize to the same tree.
+    """
+    if node is None:
+        return None
+    if isinstance(node, Term):
+        text = normalize_term(node.text)
+        return Term(text) if text else None
+    if isinstance(node, Not):
+        child = normalize(node.child)
+        if child is None:
+            return None
+        return child.child if isinstance(child, Not) else Not(child)
+
+    kind = type(node)
+    children = {}
+    for child in node.children:
+        child = normalize(child)
+        if child is None:
+            continue
+        for operand in child.children if isinstance(child, kind) else (child,):
+            children[_sort_key(operand)] = operand
+    if not children:
+        return None
+    if len(children) == 1:
+        return next(iter(children.values()))
+    return kind(tuple(children[key] for key in sorted(children)))
+
+
+def to_query_string(node: Node) -> str:
+    """Render an AST back to query syntax, fully parenthesized"""
+    if isinstance(node, Term):
+        return f'"{node.text}"'
+    if isinstance(node, Not):
+        return f"not {to_query_string(node.child)}"
+    operator = " and " if isinstance(node, And) else " or "
+    return "(" + operator.join(to_query_string(child) for child in node.children) + ")"
+
+
+def compile_node(node: Node):
+    """Compile a normalized AST into a SQLAlchemy WHERE clause over Candidate"""
+    if isinstance(node, Term):
+        return term_condition(node.text)
+    if isinstance(node, Not):
+        # search_text is NULL for candidates without skills; treat that as "no match"
+        return not_(func.coalesce(compile_node(node.child), false()))
+    combine = and_ if isinstance(node, And) else or_
+    return combine(*(compile_node(child) for child in node.children))
+
+
+@lru_cache(maxsize=settings.SEARCH_PLAN_CACHE_SIZE)
+def _parse_normalized(query: str) -> Node | None:
+    return normalize(parse_query(query))
+
+
+@lru_cache(maxsize=settings.SEARCH_PLAN_CACHE_SIZE)
+def _compile_cached(node: Node):
+    return compile_node(node)
+
+
+def normalized_query(query: str) -> Node | None:
+    """
+    Parse and normalize a boolean search query, cached by its text.
+
+    Raises:
+        BooleanQueryError: If the query is malformed
+    """
+    return _parse_normalized(" ".join(query.split()))
+
+
+def boolean_query_condition(query: str):
+    """
+    WHERE clause for a boolean skills/designations search, or None for an empty query.
+    Supports and/or/not (case-insensitive), parentheses and "quoted phrases", e.g.
+    '(Python or Go) and Kubernetes and not "project manager"'.
+
+    Parsed queries are cached by their text and compiled expressions by their
+    normalized AST, so repeated and equivalent searches skip both steps.
+
+    Raises:
+        BooleanQueryError: If the query is malformed
+    """
+    node = normalized_query(query)
+    if node is None:
+        return None
+    return _compile_cached(node)
+
+
+def plan_cache_stats() -> dict:
+    """Hit/miss counters of the parse and compile caches"""
+    return {
+        "parse": _parse_normalized.cache_info()._asdict(),
+        "compile": _compile_cached.cache_info()._asdict(),
+    }
@@ -0,0 +1,84 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncConnection
+from app.core.config import settings
+from app.db.base import engine
+from app.utils.projection import serialize_rows
+import csv
+import enum
+import io
+import logging
+import orjson
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+@asynccontextmanager
+async def snapshot_connection() -> AsyncIterator[AsyncConnection]:
+    """
+    A connection inside one REPEATABLE READ, read-only transaction: every query on it
+    sees the same consistent snapshot even while candidates are being written.
+    """
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="REPEATABLE READ", postgresql_readonly=True)
+        async with connection.begin():
+            yield connection
+
+
+async def stream_partitions(connection: AsyncConnection, query) -> AsyncIterator[list]:
+    """Yield the query's rows in batches of EXPORT_BATCH_SIZE from a server-side cursor"""
+    result = await connection.stream(query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+    async for partition in result.partitions():
+        yield partition
+
+
+async def _stream_partitions(query) -> AsyncIterator[list]:
+    async with snapshot_connection() as connection:
+        async for partition in stream_partitions(connection, query):
+            yield partition
+
+
+async def stream_ndjson(query, field_names: list[str]) -> AsyncIterator[bytes]:
+    """One JSON object per line, encoded with orjson"""
+    count = 0
+    async for rows in _stream_partitions(query):
+        items = serialize_rows(rows, field_names)
+        yield b"".join(orjson.dumps(item, option=orjson.OPT_UTC_Z) + b"\n" for item in items)
+        count += len(items)
+    logger.info(f"Exported {count} candidates as NDJSON")
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "; ".join(str(item) for item in value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def stream_csv(query, field_names: list[str]) -> AsyncIterator[bytes]:
+    """CSV with a header row; list fields such as skills are joined with "; " """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(field_names)
+    yield buffer.getvalue().encode()
+
+    count = 0
+    async for rows in _stream_partitions(query):
+        buffer.seek(0)
+        buffer.truncate()
+        for item in serialize_rows(rows, field_names):
+            writer.writerow([_csv_value(item[name]) for name in field_names])
+        yield buffer.getvalue().encode()
+        count += len(rows)
+    logger.info(f"Exported {count} candidates as CSV")
@@ -0,0 +1,72 @@
+from sqlalchemy import select, union, exists, and_, func, cast, literal, Text
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from app.core.config import settings
+from app.models.candidate import Candidate
+from app.models.candidate_term import CandidateSkill, CandidateDesignation
+from app.utils.normalization import normalize_term
+
+# Shorter terms have no trigram to look up, so the GIN index cannot narrow them down
+TRIGRAM_MIN_TERM_LENGTH = 3
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards in user input for a LIKE ... ESCAPE '/' pattern"""
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def term_candidate_ids(term: str):
+    """
+    Candidate ids with a skill or designation equal to, or starting with, term.
+    Both lookups are range scans on the term B-tree indexes.
+    """
+    pattern = f"{escape_like(normalize_term(term) or '')}%"
+    return union(
+        select(CandidateSkill.candidate_id).where(CandidateSkill.term.like(pattern, escape="/")),
+        select(CandidateDesignation.candidate_id).where(CandidateDesignation.term.like(pattern, escape="/")),
+    )
+
+
+def term_condition(term: str):
+    """
+    Match term anywhere in a candidate's skills or designations.
+    Uses the trigram index on search_text; terms too short for trigrams ("c", "go")
+    fall back to prefix lookups on the term B-tree indexes.
+    """
+    term = normalize_term(term) or ""
+    if len(term) < TRIGRAM_MIN_TERM_LENGTH:
+        return Candidate.id.in_(term_candidate_ids(term))
+    return Candidate.search_text.like(f"%{escape_like(term)}%", escape="/")
+
+
+def skill_search_condition(skill: str):
+    """Match skill anywhere in a candidate's skills (not designations)"""
+    skill = normalize_term(skill) or ""
+    pattern = f"%{escape_like(skill)}%"
+    has_skill = exists().where(
+        CandidateSkill.candidate_id == Candidate.id,
+        CandidateSkill.term.like(pattern, escape="/"),
+    )
+    if len(skill) < TRIGRAM_MIN_TERM_LENGTH:
+        return has_skill
+    # search_text narrows candidates through the trigram index; the skill rows confirm
+    return and_(Candidate.search_text.like(pattern, escape="/"), has_skill)
+
+
+def full_text_query(search_query: str):
+    """
+    Parse a web-style search ("python django", "\"machine learning\"", "java -android")
+    into a tsquery with the configured text search configuration.
+    """
+    config = cast(literal(settings.FULL_TEXT_SEARCH_CONFIG), REGCONFIG)
+    return func.websearch_to_tsquery(config, literal(search_query, Text))
+
+
+def full_text_search(search_query: str):
+    """
+    Return (condition, rank) for a full-text search over search_vector.
+    The condition is served by the GIN index; rank is ts_rank over the A/B/C weights.
+    """
+    tsquery = full_text_query(search_query)
+    condition = Candidate.search_vector.op("@@")(tsquery)
+    rank = func.ts_rank(Candidate.search_vector, tsquery)
+    return condition, rank
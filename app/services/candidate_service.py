@@ -1,28 +1,372 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.models.candidate import Candidate, CandidateStatus
-from app.utils.file_handler import extract_text_from_file, delete_file
+from sqlalchemy import select, insert, update, delete, or_, case, func, any_, bindparam, Integer, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.base import async_session_maker
+from app.models.candidate import Candidate, CandidateStatus, search_vector_expression
+from app.models.candidate_note import CandidateNote
+from app.models.candidate_term import CandidateSkill, CandidateDesignation
+from app.schemas.candidate import ParsedCandidateData
+from app.utils.file_handler import extract_text_from_file_async, delete_file
 from app.services.openai_service import parse_candidate_resume_with_openai
-from datetime import datetime
+from app.services.contact_extractor import ContactDetails, extract_contact_details, cross_check_contact
+from app.services.celery_app import celery_app
+from app.services.skill_index import skill_index
+from app.utils.normalization import normalize_email, normalize_phone, normalize_terms, candidate_contact_key, candidate_search_text
+from datetime import datetime, timedelta, timezone
+import asyncio
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
 
+async def get_candidate_by_file_hash(db: AsyncSession, file_hash: str) -> Candidate | None:
+    """Return the candidate whose resume file has the given SHA-256 digest, if any"""
+    result = await db.execute(select(Candidate).where(Candidate.file_hash == file_hash))
+    return result.scalar_one_or_none()
+
+
+def contact_match_condition(emails: list[str | None], phones: list[str | None]):
+    """
+    Build the dedup predicate on the normalized contact columns.
+    Returns None when there is nothing to match on.
+    """
+    emails = sorted({e for e in (normalize_email(email) for email in emails) if e})
+    phones = sorted({p for p in (normalize_phone(phone) for phone in phones) if p})
+
+    conditions = []
+    if emails:
+        conditions.append(Candidate.email_normalized.in_(emails))
+    if phones:
+        conditions.append(Candidate.phone_normalized.in_(phones))
+    if not conditions:
+        return None
+    return or_(*conditions)
+
+
+async def find_candidate_by_contact(db: AsyncSession, contact: ContactDetails) -> Candidate | None:
+    """
+    Find the most recently updated candidate matching the resume's primary email/phone.
+    Only the first email and phone are used; later ones are often referees' or
+    previous employers' contacts and must not pull in another candidate.
+    """
+    condition = contact_match_condition([contact.email], [contact.phone])
+    if condition is None:
+        return None
+
+    result = await db.execute(
+        select(Candidate).where(condition).order_by(Candidate.updated_at.desc()).limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+def _is_recently_processed(candidate: Candidate) -> bool:
+    """Whether the candidate's profile was parsed within KNOWN_CANDIDATE_RECENT_DAYS"""
+    if candidate.processed_at is None:
+        return False
+    processed_at = candidate.processed_at
+    if processed_at.tzinfo is None:
+        processed_at = processed_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - processed_at < timedelta(days=settings.KNOWN_CANDIDATE_RECENT_DAYS)
+
+
+async def _handle_known_candidate(
+    db: AsyncSession,
+    candidate: Candidate,
+    file_path: str,
+    filename: str,
+    file_size: int,
+    uploaded_by: int,
+    file_hash: str | None,
+) -> Candidate:
+    """Apply KNOWN_CANDIDATE_REPARSE_POLICY to a re-upload of a recently parsed candidate"""
+    if settings.KNOWN_CANDIDATE_REPARSE_POLICY == "defer_if_recent":
+        # Keep the current profile and let a worker re-parse the new file later
+        celery_app.send_task(
+            "app.services.celery_tasks.process_candidate_resume_task",
+            kwargs={
+                "file_path": file_path,
+                "filename": filename,
+                "file_size": file_size,
+                "uploaded_by": uploaded_by,
+                "file_hash": file_hash,
+            },
+        )
+        logger.info(f"Deferred re-parsing of {filename} for recently parsed candidate {candidate.id}")
+        return candidate
+
+    # Attach the new file without re-parsing
+    old_file_path = candidate.file_path
+    candidate.file_path = file_path
+    candidate.filename = filename
+    candidate.file_size = file_size
+    candidate.file_hash = file_hash
+    candidate.updated_at = func.now()
+    await db.commit()
+    await db.refresh(candidate)
+    if old_file_path != file_path:
+        remove_replaced_file(old_file_path)
+
+    logger.info(f"Attached {filename} to recently parsed candidate {candidate.id} without re-parsing")
+    return candidate
+
+
+def candidate_values(
+    parsed_data: ParsedCandidateData,
+    file_path: str,
+    filename: str,
+    file_size: int,
+    uploaded_by: int,
+    file_hash: str | None,
+    status: CandidateStatus,
+) -> dict:
+    """Column values of the candidate row for a parsed resume"""
+    email_normalized = normalize_email(parsed_data.email)
+    phone_normalized = normalize_phone(parsed_data.phone)
+    return {
+        "filename": filename,
+        "file_path": file_path,
+        "file_size": file_size,
+        "file_hash": file_hash,
+        "status": status,
+        "uploaded_by": uploaded_by,
+        "name": parsed_data.name,
+        "email": parsed_data.email,
+        "phone": parsed_data.phone,
+        "email_normalized": email_normalized,
+        "phone_normalized": phone_normalized,
+        "contact_key": candidate_contact_key(email_normalized, phone_normalized),
+        "skills": parsed_data.skills,
+        "designations": parsed_data.designations,
+        "domain_knowledge": parsed_data.domain_knowledge,
+        "search_text": candidate_search_text(parsed_data.skills, parsed_data.designations),
+        "search_vector": search_vector_expression(
+            parsed_data.skills, parsed_data.designations, parsed_data.domain_knowledge
+        ),
+        "raw_parsed_data": parsed_data.model_dump(),
+        "processed_at": func.now(),
+        "error_message": None,
+    }
+
+
+def contact_lock_statement(contacts: list[tuple[str | None, str | None]]):
+    """
+    Take transaction-level advisory locks on every normalized email and phone in
+    contacts, in a fixed order so writers cannot deadlock on them. Uploads that share
+    an email or a phone are serialized, so each sees the row the other wrote.
+    Returns None when there is nothing to lock.
+    """
+    keys = sorted(
+        {f"email:{email}" for email, _ in contacts if email} | {f"phone:{phone}" for _, phone in contacts if phone}
+    )
+    if not keys:
+        return None
+    contact_keys = (
+        select(func.unnest(bindparam("contact_keys", keys, type_=ARRAY(Text))).label("key"))
+        .order_by("key")
+        .subquery("contact_keys")
+    )
+    return select(func.pg_advisory_xact_lock(func.hashtext(contact_keys.c.key)))
+
+
+def contact_match_statement(email_normalized: str | None, phone_normalized: str | None, contact_key: str | None):
+    """
+    Find and lock the existing candidate with the same normalized email OR phone,
+    returning (id, file_path). The row already holding contact_key comes first, so
+    updating it can never collide with another row's key; then an email match, then
+    the most recently updated. Returns None when there is nothing to match on.
+    """
+    condition = contact_match_condition([email_normalized], [phone_normalized])
+    if condition is None:
+        return None
+    return (
+        select(Candidate.id, Candidate.file_path)
+        .where(condition)
+        .order_by(
+            case(
+                (Candidate.contact_key == contact_key, 0),
+                (Candidate.email_normalized == email_normalized, 1),
+                else_=2,
+            ),
+            Candidate.updated_at.desc(),
+        )
+        .limit(1)
+        .with_for_update()
+    )
+
+
+def build_candidate_write(values: dict, candidate_id: int | None):
+    """
+    INSERT a new candidate, or UPDATE candidate_id with values, RETURNING the Candidate.
+    The original uploader and creation time are kept on update.
+    """
+    if candidate_id is None:
+        statement = insert(Candidate).values(**values)
+    else:
+        updated_values = {key: value for key, value in values.items() if key != "uploaded_by"}
+        # Database time, like the server default: index refreshes and snapshot watermarks compare on it
+        updated_values["updated_at"] = func.now()
+        statement = update(Candidate).where(Candidate.id == candidate_id).values(**updated_values)
+    return statement.returning(Candidate).execution_options(populate_existing=True)
+
+
+def write_candidate(session: Session, values: dict) -> tuple[Candidate, bool, str | None]:
+    """
+    Insert or update the candidate with values, without committing: lock its normalized
+    email and phone, lock the existing candidate matching either, then write it and its
+    search term rows. Takes a sync Session so the Celery task can call it directly and
+    async callers through AsyncSession.run_sync.
+
+    Returns:
+        tuple: (candidate, is_update, old_file_path) where old_file_path is the replaced
+               resume file to delete once the transaction commits
+    """
+    email_normalized, phone_normalized = values["email_normalized"], values["phone_normalized"]
+
+    lock = contact_lock_statement([(email_normalized, phone_normalized)])
+    if lock is not None:
+        session.execute(lock)
+    match = None
+    match_statement = contact_match_statement(email_normalized, phone_normalized, values["contact_key"])
+    if match_statement is not None:
+        match = session.execute(match_statement).first()
+
+    candidate = session.execute(build_candidate_write(values, match.id if match else None)).scalar_one()
+    for statement in candidate_term_statements(candidate.id, candidate.skills, candidate.designations):
+        session.execute(statement)
+
+    old_file_path = match.file_path if match else None
+    return candidate, match is not None, old_file_path if old_file_path != values["file_path"] else None
+
+
+async def upsert_parsed_candidate(
+    db: AsyncSession,
+    parsed_data: ParsedCandidateData,
+    file_path: str,
+    filename: str,
+    file_size: int,
+    uploaded_by: int,
+    file_hash: str | None = None,
+) -> tuple[Candidate, bool, str | None]:
+    """
+    Insert or update the candidate for a parsed resume, without committing.
+    Candidates are matched on normalized email OR phone under advisory locks on both,
+    so concurrent uploads of the same person end up on one row.
+
+    Returns:
+        tuple: (candidate, is_update, old_file_path), see write_candidate
+    """
+    values = candidate_values(
+        parsed_data, file_path, filename, file_size, uploaded_by, file_hash, CandidateStatus.UPLOADED
+    )
+    candidate, is_update, old_file_path = await db.run_sync(write_candidate, values)
+
+    if is_update:
+        logger.info(f"Updated existing candidate {candidate.id} with matching email/phone from {filename}")
+    else:
+        logger.info(f"Created new candidate {candidate.id} for {filename}")
+    return candidate, is_update, old_file_path
+
+
+def candidate_term_statements(candidate_id: int, skills: list[str] | None, designations: list[str] | None) -> list:
+    """
+    Statements that replace a candidate's rows in candidate_skills/candidate_designations
+    with the canonical form of skills/designations. Run them in the same transaction as
+    the candidate write; they work with both the async and the sync session.
+    """
+    statements = []
+    for model, terms in ((CandidateSkill, skills), (CandidateDesignation, designations)):
+        statements.append(delete(model).where(model.candidate_id == candidate_id))
+        rows = [{"candidate_id": candidate_id, "term": term} for term in normalize_terms(terms)]
+        if rows:
+            statements.append(insert(model).values(rows))
+    return statements
+
+
+async def sync_candidate_terms(db: AsyncSession, candidate: Candidate) -> None:
+    """Bring the candidate's search term rows in line with its skills and designations"""
+    for statement in candidate_term_statements(candidate.id, candidate.skills, candidate.designations):
+        await db.execute(statement)
+
+
+async def update_candidate_statuses(
+    db: AsyncSession,
+    candidate_ids: list[int],
+    new_status: CandidateStatus,
+    user_id: int,
+    note: str | None = None,
+) -> list:
+    """
+    Move candidates to new_status with a single UPDATE ... RETURNING and, when a note
+    is given, a single multi-row CandidateNote insert, without committing.
+
+    Returns:
+        list: (id, previous_status, new_status) rows for the candidates that exist
+    """
+    ids = bindparam("candidate_ids", list(candidate_ids), type_=ARRAY(Integer))
+    # Lock the rows (in id order, so concurrent bulk moves cannot deadlock) and read their
+    # current status, which the UPDATE returns next to the new one
+    previous = (
+        select(Candidate.id, Candidate.status)
+        .where(Candidate.id == any_(ids))
+        .order_by(Candidate.id)
+        .with_for_update()
+        .subquery("previous")
+    )
+    statement = (
+        update(Candidate)
+        .where(Candidate.id == previous.c.id)
+        .values(status=new_status)
+        .returning(Candidate.id, previous.c.status.label("previous_status"), Candidate.status.label("new_status"))
+        .execution_options(synchronize_session=False)
+    )
+    rows = (await db.execute(statement)).all()
+
+    if note and rows:
+        await db.execute(
+            insert(CandidateNote).values([
+                {
+                    "candidate_id": row.id,
+                    "user_id": user_id,
+                    "note": note,
+                    "previous_status": row.previous_status.value,
+                    "new_status": row.new_status.value,
+                }
+                for row in rows
+            ])
+        )
+    return rows
+
+
+def remove_replaced_file(old_file_path: str | None) -> None:
+    """Delete a resume file that was replaced by a newer upload"""
+    if not old_file_path:
+        return
+    try:
+        if os.path.exists(old_file_path):
+            os.remove(old_file_path)
+            logger.info(f"Deleted old candidate resume file: {old_file_path}")
+    except Exception as cleanup_error:
+        logger.warning(f"Failed to delete old candidate resume file {old_file_path}: {cleanup_error}")
+
+
 async def process_candidate_resume(
     db: AsyncSession,
     file_path: str,
     filename: str,
     file_size: int,
     uploaded_by: int,
+    file_hash: str | None = None,
 ) -> Candidate:
     """
     Process candidate resume synchronously:
-    1. Extract text from file
-    2. Parse with OpenAI
-    3. Check for duplicates (email/phone)
-    4. Create new candidate profile or update existing one
+    1. Short-circuit if an identical file (same SHA-256) was already processed
+    2. Extract text from file
+    3. Parse with OpenAI
+    4. Create the candidate, or update the one with the same normalized email or phone
 
     Args:
         db: Database session
@@ -30,6 +374,7 @@ async def process_candidate_resume(
         filename: Original filename
         file_size: Size of the file in bytes
         uploaded_by: ID of the user who uploaded the resume
+        file_hash: SHA-256 hex digest of the file content
 
     Returns:
         Candidate: The created or updated candidate record
@@ -38,108 +383,64 @@ async def process_candidate_resume(
         ValueError: If text extraction or parsing fails
     """
     try:
+        # Identical file already on record - skip extraction and OpenAI entirely
+        if file_hash:
+            duplicate = await get_candidate_by_file_hash(db, file_hash)
+            if duplicate:
+                logger.info(f"Candidate resume {filename} is identical to the file of candidate {duplicate.id}. Skipping parsing.")
+                await delete_file(file_path)
+                return duplicate
+
         # Extract text from file
         logger.info(f"Extracting text from candidate resume file: {filename}")
-        resume_text = extract_text_from_file(file_path)
+        resume_text = await extract_text_from_file_async(file_path)
 
         if not resume_text:
             raise ValueError("No text extracted from candidate resume")
 
+        # Look for a known candidate before paying for the OpenAI call
+        contact = extract_contact_details(resume_text)
+        if settings.KNOWN_CANDIDATE_REPARSE_POLICY != "always":
+            known_candidate = await find_candidate_by_contact(db, contact)
+            if known_candidate and _is_recently_processed(known_candidate):
+                return await _handle_known_candidate(
+                    db, known_candidate, file_path, filename, file_size, uploaded_by, file_hash
+                )
+
         # Validate and parse with OpenAI (validation happens inside the function)
         logger.info(f"Validating and parsing candidate resume {filename} with OpenAI")
-        parsed_data = await parse_candidate_resume_with_openai(resume_text)
-
-        # Check if a candidate with the same email or phone already exists
-        existing_candidate = None
-        if parsed_data.email or parsed_data.phone:
-            query = select(Candidate)
-
-            if parsed_data.email and parsed_data.phone:
-                # Check for either email or phone match
-                result = await db.execute(
-                    query.where(
-                        (Candidate.email == parsed_data.email) |
-                        (Candidate.phone == parsed_data.phone)
-                    )
-                )
-            elif parsed_data.email:
-                # Check only email
-                result = await db.execute(
-                    query.where(Candidate.email == parsed_data.email)
-                )
-            else:
-                # Check only phone
-                result = await db.execute(
-                    query.where(Candidate.phone == parsed_data.phone)
-                )
+        parsed_data = await parse_candidate_resume_with_openai(resume_text, db=db)
 
-            existing_candidate = result.scalar_one_or_none()
-
-        if existing_candidate:
-            # Update the existing candidate record
-            logger.info(f"Found existing candidate {existing_candidate.id} with matching email/phone. Updating existing record.")
-
-            # Store old file path for cleanup
-            old_file_path = existing_candidate.file_path
-
-            # Update existing candidate with new parsed data
-            existing_candidate.name = parsed_data.name
-            existing_candidate.email = parsed_data.email
-            existing_candidate.phone = parsed_data.phone
-            existing_candidate.skills = parsed_data.skills
-            existing_candidate.designations = parsed_data.designations
-            existing_candidate.domain_knowledge = parsed_data.domain_knowledge
-            existing_candidate.raw_parsed_data = parsed_data.model_dump()
-            existing_candidate.status = CandidateStatus.UPLOADED
-            existing_candidate.processed_at = datetime.utcnow()
-            existing_candidate.error_message = None
-
-            # Update file path and metadata to reflect latest upload
-            existing_candidate.file_path = file_path
-            existing_candidate.filename = filename
-            existing_candidate.file_size = file_size
-            existing_candidate.updated_at = datetime.utcnow()
+        # Cross-check the LLM's contact details against the document text
+        email, phone, issues = cross_check_contact(parsed_data.email, parsed_data.phone, contact)
+        if issues:
+            logger.warning(f"Corrected contact details for {filename}: {'; '.join(issues)}")
+            parsed_data = parsed_data.model_copy(update={"email": email, "phone": phone})
 
-            await db.commit()
-            await db.refresh(existing_candidate)
-
-            # Delete old resume file after successful database update
-            if old_file_path and old_file_path != file_path:
-                try:
-                    if os.path.exists(old_file_path):
-                        os.remove(old_file_path)
-                        logger.info(f"Deleted old candidate resume file: {old_file_path}")
-                except Exception as cleanup_error:
-                    logger.warning(f"Failed to delete old candidate resume file {old_file_path}: {cleanup_error}")
-
-            logger.info(f"Successfully updated existing candidate {existing_candidate.id}")
-            return existing_candidate
-        else:
-            # No duplicate found, create new candidate
-            logger.info(f"No existing candidate found. Creating new record for {filename}")
-
-            new_candidate = Candidate(
-                filename=filename,
-                file_path=file_path,
-                file_size=file_size,
-                status=CandidateStatus.UPLOADED,
-                uploaded_by=uploaded_by,
-                name=parsed_data.name,
-                email=parsed_data.email,
-                phone=parsed_data.phone,
-                skills=parsed_data.skills,
-                designations=parsed_data.designations,
-                domain_knowledge=parsed_data.domain_knowledge,
-                raw_parsed_data=parsed_data.model_dump(),
-                processed_at=datetime.utcnow(),
+        try:
+            candidate, is_update, old_file_path = await upsert_parsed_candidate(
+                db, parsed_data, file_path, filename, file_size, uploaded_by, file_hash
             )
-
-            db.add(new_candidate)
             await db.commit()
-            await db.refresh(new_candidate)
+        except IntegrityError:
+            # A concurrent upload of the same file won the race
+            await db.rollback()
+            if not file_hash:
+                raise
+            duplicate = await get_candidate_by_file_hash(db, file_hash)
+            if not duplicate:
+                raise
+            logger.info(f"Candidate resume {filename} was stored concurrently as candidate {duplicate.id}")
+            await delete_file(file_path)
+            return duplicate
 
-            logger.info(f"Successfully created new candidate {new_candidate.id}")
-            return new_candidate
+        # Delete old resume file after successful database update
+        remove_replaced_file(old_file_path)
+        skill_index.update_candidate(candidate)
+
+        action = "updated existing" if is_update else "created new"
+        logger.info(f"Successfully {action} candidate {candidate.id}")
+        return candidate
 
     except Exception as e:
         logger.error(f"Error processing candidate resume {filename}: {str(e)}")
@@ -151,3 +452,150 @@ async def process_candidate_resume(
         except Exception as cleanup_error:
             logger.warning(f"Failed to clean up file {file_path}: {cleanup_error}")
         raise
+
+
+async def _extract_and_parse(item: dict, semaphore: asyncio.Semaphore) -> None:
+    """Run extraction and OpenAI parsing for one bulk item, recording the outcome on it"""
+    async with semaphore:
+        try:
+            resume_text = await extract_text_from_file_async(item["file_path"])
+            if not resume_text:
+                raise ValueError("No text extracted from candidate resume")
+            # Items parse concurrently, so each cache access gets its own short-lived session
+            parsed_data = await parse_candidate_resume_with_openai(resume_text, session_maker=async_session_maker)
+            email, phone, issues = cross_check_contact(
+                parsed_data.email, parsed_data.phone, extract_contact_details(resume_text)
+            )
+            if issues:
+                logger.warning(f"Corrected contact details for {item['filename']}: {'; '.join(issues)}")
+                parsed_data = parsed_data.model_copy(update={"email": email, "phone": phone})
+            item["parsed_data"] = parsed_data
+        except Exception as e:
+            logger.error(f"Error processing candidate resume {item['filename']}: {str(e)}")
+            item["status"] = "failed"
+            item["error"] = str(e)
+
+
+async def _write_bulk_batch(db: AsyncSession, batch: list[dict], uploaded_by: int) -> None:
+    """Upsert a batch of parsed resumes and commit them in one transaction"""
+    # Lock every contact of the batch up front and in order, so concurrent batches cannot deadlock
+    lock = contact_lock_statement([
+        (normalize_email(item["parsed_data"].email), normalize_phone(item["parsed_data"].phone))
+        for item in batch
+    ])
+    if lock is not None:
+        await db.execute(lock)
+
+    staged = []
+    for item in batch:
+        candidate, is_update, old_file_path = await upsert_parsed_candidate(
+            db,
+            item["parsed_data"],
+            item["file_path"],
+            item["filename"],
+            item["file_size"],
+            uploaded_by,
+            item["file_hash"],
+        )
+        staged.append((item, candidate, is_update, old_file_path))
+
+    await db.commit()
+
+    for item, candidate, is_update, old_file_path in staged:
+        item["status"] = "updated" if is_update else "created"
+        item["candidate_id"] = candidate.id
+        remove_replaced_file(old_file_path)
+        skill_index.update_candidate(candidate)
+
+
+async def process_candidate_resumes_bulk(
+    db: AsyncSession,
+    files: list[tuple[str, str, int, str]],
+    uploaded_by: int,
+) -> list[dict]:
+    """
+    Process many saved resume files at once:
+    1. Resolve files identical to existing candidates with a single hash lookup
+    2. Extract and parse the rest concurrently, bounded by BULK_UPLOAD_CONCURRENCY
+    3. Write the results in transactions of BULK_COMMIT_BATCH_SIZE candidates
+
+    Args:
+        db: Database session
+        files: (filename, file_path, file_size, file_hash) for each saved resume
+        uploaded_by: ID of the user who uploaded the resumes
+
+    Returns:
+        list: One result dict per file with filename, status, candidate_id and error
+    """
+    items = [
+        {
+            "filename": filename,
+            "file_path": file_path,
+            "file_size": file_size,
+            "file_hash": file_hash,
+            "status": None,
+            "candidate_id": None,
+            "error": None,
+            "parsed_data": None,
+        }
+        for filename, file_path, file_size, file_hash in files
+    ]
+    if not items:
+        return []
+
+    try:
+        # Identical files already on record, or repeated within this upload
+        hashes = {item["file_hash"] for item in items}
+        result = await db.execute(
+            select(Candidate.file_hash, Candidate.id).where(Candidate.file_hash.in_(hashes))
+        )
+        known_hashes = dict(result.all())
+        seen_hashes = set()
+        pending = []
+        for item in items:
+            if item["file_hash"] in known_hashes:
+                item["status"] = "duplicate"
+                item["candidate_id"] = known_hashes[item["file_hash"]]
+            elif item["file_hash"] in seen_hashes:
+                item["status"] = "duplicate"
+                item["error"] = "Identical file appears earlier in this upload"
+            else:
+                seen_hashes.add(item["file_hash"])
+                pending.append(item)
+                continue
+            await delete_file(item["file_path"])
+
+        # Fan out extraction and parsing; the session is not shared across these tasks
+        logger.info(f"Bulk processing {len(pending)} candidate resumes ({len(items) - len(pending)} duplicates skipped)")
+        semaphore = asyncio.Semaphore(settings.BULK_UPLOAD_CONCURRENCY)
+        await asyncio.gather(*(_extract_and_parse(item, semaphore) for item in pending))
+
+        # Write parsed candidates in a few transactions
+        parsed = [item for item in pending if item["parsed_data"] is not None]
+        batch_size = settings.BULK_COMMIT_BATCH_SIZE
+        for start in range(0, len(parsed), batch_size):
+            batch = parsed[start:start + batch_size]
+            try:
+                await _write_bulk_batch(db, batch, uploaded_by)
+            except Exception as e:
+                # Retry one by one so a single bad row does not fail the whole batch
+                logger.warning(f"Bulk batch write failed, retrying individually: {e}")
+                await db.rollback()
+                for item in batch:
+                    try:
+                        await _write_bulk_batch(db, [item], uploaded_by)
+                    except Exception as item_error:
+                        await db.rollback()
+                        logger.error(f"Error saving candidate resume {item['filename']}: {item_error}")
+                        item["status"] = "failed"
+                        item["error"] = str(item_error)
+    finally:
+        # Only stored candidates keep their file, including when processing fails midway
+        for item in items:
+            if item["status"] not in ("created", "updated"):
+                await delete_file(item["file_path"])
+
+    return [
+        {key: item[key] for key in ("filename", "status", "candidate_id", "error")}
+        for item in items
+    ]
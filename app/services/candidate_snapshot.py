@@ -0,0 +1,201 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from sqlalchemy import select, func
+from app.core.config import settings
+from app.models.candidate import Candidate, CandidateStatus
+from app.services.candidate_export import snapshot_connection, stream_partitions
+import asyncio
+import logging
+import os
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMATS = ("parquet", "arrow")
+# Overlap between incremental snapshots so writes committed around the watermark are not missed;
+# readers keep the row with the latest updated_at per id
+INCREMENTAL_OVERLAP = timedelta(seconds=5)
+WATERMARK_KEY = b"watermark"
+SINCE_KEY = b"since"
+
+# Every status value is in the dictionary up front, so all batches share one dictionary
+# (Arrow IPC files do not allow it to change between batches)
+STATUS_VALUES = pa.array([status.value for status in CandidateStatus], type=pa.string())
+STATUS_INDEX = {status.value: index for index, status in enumerate(CandidateStatus)}
+
+TIMESTAMP = pa.timestamp("us", tz="UTC")
+SNAPSHOT_SCHEMA = pa.schema([
+    pa.field("id", pa.int64(), nullable=False),
+    pa.field("status", pa.dictionary(pa.int8(), pa.string()), nullable=False),
+    pa.field("name", pa.string()),
+    pa.field("email", pa.string()),
+    pa.field("email_normalized", pa.string()),
+    pa.field("phone", pa.string()),
+    pa.field("phone_normalized", pa.string()),
+    pa.field("skills", pa.list_(pa.string())),
+    pa.field("designations", pa.list_(pa.string())),
+    pa.field("domain_knowledge", pa.string()),
+    pa.field("filename", pa.string()),
+    pa.field("file_size", pa.int64()),
+    pa.field("uploaded_by", pa.int64()),
+    pa.field("created_at", TIMESTAMP, nullable=False),
+    pa.field("updated_at", TIMESTAMP, nullable=False),
+    pa.field("processed_at", TIMESTAMP),
+])
+_COLUMNS = [getattr(Candidate, field.name) for field in SNAPSHOT_SCHEMA]
+
+
+def _string_list(value) -> list[str] | None:
+    if not isinstance(value, list):
+        return None
+    return [str(item) for item in value if item is not None]
+
+
+def _record_batch(rows: list) -> pa.RecordBatch:
+    """Build a record batch in SNAPSHOT_SCHEMA from candidate rows, column by column"""
+    columns = list(zip(*rows))
+    arrays = []
+    for field, values in zip(SNAPSHOT_SCHEMA, columns):
+        if field.name == "status":
+            indices = pa.array([STATUS_INDEX[getattr(value, "value", value)] for value in values], type=pa.int8())
+            arrays.append(pa.DictionaryArray.from_arrays(indices, STATUS_VALUES))
+        elif field.name in ("skills", "designations"):
+            arrays.append(pa.array([_string_list(value) for value in values], type=field.type))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=SNAPSHOT_SCHEMA)
+
+
+def snapshot_path(format: str, incremental: bool, taken_at: datetime) -> Path:
+    kind = "delta" if incremental else "full"
+    return Path(settings.SNAPSHOT_DIR) / f"candidates_{kind}_{taken_at:%Y%m%d_%H%M%S}.{format}"
+
+
+def read_snapshot_metadata(path: str | Path) -> dict:
+    """Watermark and since of a snapshot file, read from its schema metadata"""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        metadata = pq.read_schema(path).metadata or {}
+    else:
+        with pa.memory_map(str(path)) as source:
+            metadata = ipc.open_file(source).schema.metadata or {}
+    return {
+        "watermark": datetime.fromisoformat(metadata[WATERMARK_KEY].decode()) if WATERMARK_KEY in metadata else None,
+        "since": datetime.fromisoformat(metadata[SINCE_KEY].decode()) if SINCE_KEY in metadata else None,
+    }
+
+
+def latest_watermark(directory: str | Path | None = None) -> datetime | None:
+    """Watermark of the newest snapshot in directory, the starting point for the next delta"""
+    directory = Path(directory or settings.SNAPSHOT_DIR)
+    paths = sorted(
+        (path for path in directory.glob("candidates_*") if path.suffix.lstrip(".") in SNAPSHOT_FORMATS),
+        key=lambda path: path.stat().st_mtime,
+    )
+    for path in reversed(paths):
+        watermark = read_snapshot_metadata(path)["watermark"]
+        if watermark is not None:
+            return watermark
+    return None
+
+
+def read_snapshot(path: str | Path) -> pa.Table:
+    """
+    Open a snapshot for analytic scans. The file is memory-mapped, so Arrow IPC
+    snapshots are read without copying and Parquet column chunks are paged in on demand.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pq.read_table(path, memory_map=True)
+    with pa.memory_map(str(path)) as source:
+        return ipc.open_file(source).read_all()
+
+
+class _SnapshotWriter:
+    """Write record batches to a Parquet or Arrow IPC file"""
+
+    def __init__(self, path: Path, format: str, schema: pa.Schema):
+        self._sink = pa.OSFile(str(path), "wb")
+        if format == "parquet":
+            self._writer = pq.ParquetWriter(self._sink, schema, compression="zstd")
+        else:
+            self._writer = ipc.new_file(self._sink, schema)
+        self._format = format
+
+    def write_rows(self, rows: list) -> None:
+        batch = _record_batch(rows)
+        if self._format == "parquet":
+            self._writer.write_batch(batch, row_group_size=settings.SNAPSHOT_ROW_GROUP_SIZE)
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+        self._sink.close()
+
+
+async def write_snapshot(format: str = "parquet", since: datetime | None = None, path: str | Path | None = None) -> dict:
+    """
+    Write candidates to a columnar snapshot file in batches.
+
+    With since, only candidates updated since then (less INCREMENTAL_OVERLAP) are
+    written, for incremental exports. All rows come from one database snapshot, and
+    its start time is stored in the file as the watermark for the next delta. The
+    file is written under a temporary name and renamed into place when complete.
+
+    Returns:
+        dict: path, rows, watermark, since and size in bytes of the snapshot
+    """
+    if format not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unknown snapshot format '{format}'. Allowed formats: {', '.join(SNAPSHOT_FORMATS)}")
+
+    query = select(*_COLUMNS)
+    if since is not None:
+        query = query.where(Candidate.updated_at >= since - INCREMENTAL_OVERLAP)
+    query = query.order_by(Candidate.id)
+
+    async with snapshot_connection() as connection:
+        # now() is the start of this transaction, so every write after it is in the next delta
+        watermark = (await connection.execute(select(func.now()))).scalar_one()
+        metadata = {WATERMARK_KEY: watermark.isoformat().encode()}
+        if since is not None:
+            metadata[SINCE_KEY] = since.isoformat().encode()
+        schema = SNAPSHOT_SCHEMA.with_metadata(metadata)
+
+        path = Path(path) if path else snapshot_path(format, since is not None, watermark.astimezone(timezone.utc))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f".{path.name}.tmp")
+
+        writer = _SnapshotWriter(temporary_path, format, schema)
+        count = 0
+        pending = []
+        try:
+            # Batches are converted and written off the event loop
+            async for rows in stream_partitions(connection, query):
+                pending.extend(rows)
+                if len(pending) >= settings.SNAPSHOT_ROW_GROUP_SIZE:
+                    await asyncio.to_thread(writer.write_rows, pending)
+                    count += len(pending)
+                    pending = []
+            if pending:
+                await asyncio.to_thread(writer.write_rows, pending)
+                count += len(pending)
+            await asyncio.to_thread(writer.close)
+        except BaseException:
+            writer.close()
+            temporary_path.unlink(missing_ok=True)
+            raise
+
+    os.replace(temporary_path, path)
+    size = path.stat().st_size
+    logger.info(f"Wrote {format} snapshot {path}: {count} candidates, {size} bytes")
+    return {
+        "path": str(path),
+        "format": format,
+        "rows": count,
+        "watermark": watermark,
+        "since": since,
+        "size": size,
+    }
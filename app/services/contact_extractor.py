@@ -0,0 +1,90 @@
+from dataclasses import dataclass, field
+from typing import Iterator
+import re
+
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+# Digits with optional leading +, spaces, dots, dashes and parentheses in between;
+# never spans a line break, so numbers on consecutive lines stay separate
+_PHONE_RE = re.compile(r"(?<![\w+])\+?\(?\d[\d \t().-]{8,20}\d(?!\w)")
+
+
+@dataclass
+class ContactDetails:
+    emails: list[str] = field(default_factory=list)
+    phones: list[str] = field(default_factory=list)
+
+    @property
+    def email(self) -> str | None:
+        return self.emails[0] if self.emails else None
+
+    @property
+    def phone(self) -> str | None:
+        return self.phones[0] if self.phones else None
+
+
+def phone_digits(phone: str) -> str:
+    """Strip a phone number down to its digits for comparison"""
+    return re.sub(r"\D", "", phone)
+
+
+def iter_phone_numbers(text: str) -> Iterator[str]:
+    """Phone numbers in text, in document order, as written"""
+    for match in _PHONE_RE.findall(text):
+        # 10-15 digits covers national and E.164 numbers and skips date ranges
+        if 10 <= len(phone_digits(match)) <= 15:
+            yield match.strip()
+
+
+def extract_contact_details(text: str) -> ContactDetails:
+    """
+    Deterministically extract email addresses and phone numbers from resume text.
+    Results keep document order with duplicates removed; emails are lower-cased.
+    """
+    emails = []
+    for match in EMAIL_RE.findall(text):
+        email = match.lower().rstrip(".")
+        if email not in emails:
+            emails.append(email)
+
+    phones = []
+    seen_digits = set()
+    for phone in iter_phone_numbers(text):
+        digits = phone_digits(phone)[-10:]
+        if digits in seen_digits:
+            continue
+        seen_digits.add(digits)
+        phones.append(phone)
+
+    return ContactDetails(emails=emails, phones=phones)
+
+
+def cross_check_contact(email: str | None, phone: str | None, contact: ContactDetails) -> tuple[str | None, str | None, list[str]]:
+    """
+    Compare LLM-extracted email/phone against the locally extracted ones.
+    Values missing from the LLM result, or not present in the document at all,
+    are replaced with the local value when one exists.
+
+    Returns:
+        tuple: (email, phone, issues) where issues describes any corrections made
+    """
+    issues = []
+
+    if contact.email:
+        if not email:
+            issues.append("email missing from LLM result")
+            email = contact.email
+        elif email.lower() not in contact.emails:
+            issues.append(f"LLM email {email} not found in document")
+            email = contact.email
+
+    if contact.phone:
+        # Compare the last 10 digits so country-code variants still match
+        local_digits = {phone_digits(p)[-10:] for p in contact.phones}
+        if not phone:
+            issues.append("phone missing from LLM result")
+            phone = contact.phone
+        elif phone_digits(phone)[-10:] not in local_digits:
+            issues.append(f"LLM phone {phone} not found in document")
+            phone = contact.phone
+
+    return email, phone, issues
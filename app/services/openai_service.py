@@ -1,20 +1,160 @@
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, RateLimitError
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.core.config import settings
-from app.schemas.candidate import ParsedCandidateData
+from app.schemas.candidate import ParsedCandidateData, ResumeParseResult
+from app.services.parse_cache import parse_cache, make_cache_key
+from app.services.rate_limiter import openai_rate_limiter
+from app.services.resume_preprocessor import condense_resume_text, count_tokens, split_into_chunks
+from app.services.resume_classifier import is_obvious_non_resume
+from contextlib import asynccontextmanager
+import asyncio
 import json
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
-client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+SYSTEM_PROMPT = "You are a professional resume validator and parser that first checks if a document is a resume, then extracts structured data from valid resumes."
 
-async def parse_candidate_resume_with_openai(resume_text: str) -> ParsedCandidateData:
+
+class ResumeParseError(ValueError):
+    """Parsing failed in a way that retrying the whole pipeline will not fix"""
+
+# Retries are handled in _create_chat_completion so 429s go through the shared rate limiter
+client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
+
+
+def _retry_after_seconds(error: RateLimitError) -> float | None:
+    """Read the Retry-After hint from a 429 response, if present"""
+    try:
+        return float(error.response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+async def _create_chat_completion(messages: list[dict], max_tokens: int, **kwargs):
+    """
+    Call the chat completions API through the shared rate limiter.
+    A 429 slows the limiter down and is retried locally up to OPENAI_RATE_LIMIT_RETRIES
+    times instead of failing the whole pipeline.
+    """
+    estimated_tokens = sum(count_tokens(m["content"]) for m in messages) + max_tokens
+
+    for attempt in range(settings.OPENAI_RATE_LIMIT_RETRIES + 1):
+        await openai_rate_limiter.acquire(estimated_tokens)
+        try:
+            raw_response = await client.chat.completions.with_raw_response.create(
+                model=settings.OPENAI_MODEL,
+                messages=messages,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+        except RateLimitError as e:
+            await openai_rate_limiter.record_rate_limited(_retry_after_seconds(e))
+            if attempt == settings.OPENAI_RATE_LIMIT_RETRIES:
+                raise
+            continue
+
+        await openai_rate_limiter.record_success(raw_response.headers)
+        response = raw_response.parse()
+        if response.usage:
+            logger.info(
+                f"OpenAI usage: {response.usage.prompt_tokens} prompt + "
+                f"{response.usage.completion_tokens} completion tokens (estimated {estimated_tokens})"
+            )
+        return response
+
+
+def _response_json_schema() -> dict:
+    """Strict JSON schema for the parser reply, derived from ResumeParseResult"""
+    properties = {}
+    for name, field in ResumeParseResult.model_fields.items():
+        if name in ("skills", "designations"):
+            properties[name] = {"type": "array", "items": {"type": "string"}}
+        elif field.annotation is bool:
+            properties[name] = {"type": "boolean"}
+        elif field.is_required():
+            properties[name] = {"type": "string"}
+        else:
+            properties[name] = {"type": ["string", "null"]}
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def _response_format_kwargs() -> dict:
+    """Extra chat completion arguments for the configured OPENAI_RESPONSE_FORMAT"""
+    if settings.OPENAI_RESPONSE_FORMAT == "json_schema":
+        return {
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "resume_parse_result", "strict": True, "schema": _response_json_schema()},
+            }
+        }
+    if settings.OPENAI_RESPONSE_FORMAT == "json_object":
+        return {"response_format": {"type": "json_object"}}
+    return {}
+
+
+def _repair_json(content: str) -> str:
+    """Cheap local fixes for common malformed replies: fences, prose around the object, trailing commas"""
+    content = re.sub(r"^```(?:json)?|```$", "", content.strip()).strip()
+    start, end = content.find("{"), content.rfind("}")
+    if start != -1 and end > start:
+        content = content[start:end + 1]
+    content = content.replace("\u201c", '"').replace("\u201d", '"')
+    return re.sub(r",\s*([}\]])", r"\1", content)
+
+
+def _load_parse_result(content: str) -> ResumeParseResult:
+    """
+    Validate a parser reply against ResumeParseResult, repairing it locally if needed.
+
+    Raises:
+        json.JSONDecodeError, ValidationError: If the reply cannot be used even after repair
+    """
+    try:
+        return ResumeParseResult.model_validate_json(content)
+    except ValidationError:
+        return ResumeParseResult.model_validate(json.loads(_repair_json(content)))
+
+
+@asynccontextmanager
+async def _cache_session(db: AsyncSession | None, session_maker: async_sessionmaker | None):
+    """Yield db, or a short-lived session from session_maker that is committed on exit"""
+    if db is not None or session_maker is None:
+        yield db
+        return
+    async with session_maker() as cache_db:
+        yield cache_db
+        try:
+            await cache_db.commit()
+        except Exception as e:
+            logger.warning(f"Parse cache commit failed: {e}")
+
+
+async def parse_candidate_resume_with_openai(
+    resume_text: str,
+    db: AsyncSession | None = None,
+    session_maker: async_sessionmaker | None = None,
+) -> ParsedCandidateData:
     """
     Validate and parse candidate resume text using OpenAI.
-    First validates that the document is a resume, then extracts structured data.
+    Obvious non-resumes are rejected by a local classifier before any network call.
+    Results are cached by normalized text, prompt version and model, so repeat
+    parses of the same content skip the OpenAI round trip.
 
     Args:
         resume_text: Extracted text from candidate's resume
+        db: Optional database session enabling the persistent cache tier
+        session_maker: For callers without a session of their own (concurrent bulk
+                       parses, Celery tasks): the persistent cache tier is read and
+                       written through short-lived sessions from it, so no connection
+                       is held during the OpenAI call
 
     Returns:
         ParsedCandidateData: Structured candidate data
@@ -22,6 +162,120 @@ async def parse_candidate_resume_with_openai(resume_text: str) -> ParsedCandidat
     Raises:
         ValueError: If document is not a resume or parsing fails
     """
+    if settings.RESUME_CLASSIFIER_ENABLED and is_obvious_non_resume(resume_text):
+        raise ResumeParseError("Document is not a valid resume")
+
+    if not settings.PARSE_CACHE_ENABLED:
+        return await _request_parse_from_openai(resume_text)
+
+    cache_key = make_cache_key(resume_text, settings.PARSE_PROMPT_VERSION, settings.OPENAI_MODEL)
+    async with _cache_session(db, session_maker) as cache_db:
+        cached = await parse_cache.get(cache_key, cache_db)
+    if cached is not None:
+        logger.info(f"Parse cache hit for key {cache_key[:12]} ({parse_cache.stats()})")
+        return cached
+
+    parsed_data = await _request_parse_from_openai(resume_text)
+    async with _cache_session(db, session_maker) as cache_db:
+        await parse_cache.set(
+            cache_key,
+            parsed_data,
+            model=settings.OPENAI_MODEL,
+            prompt_version=settings.PARSE_PROMPT_VERSION,
+            db=cache_db,
+        )
+    return parsed_data
+
+
+def _dedupe_terms(term_lists: list[list[str]]) -> list[str]:
+    """Merge term lists in order, dropping case-insensitive duplicates"""
+    seen = set()
+    merged = []
+    for terms in term_lists:
+        for term in terms:
+            key = term.strip().lower()
+            if key and key not in seen:
+                seen.add(key)
+                merged.append(term.strip())
+    return merged
+
+
+def merge_parse_results(results: list[ResumeParseResult]) -> ResumeParseResult:
+    """
+    Deterministically merge per-chunk parse results in chunk order.
+    The first chunk decides whether the document is a resume; contact fields take the
+    first non-empty value, and skills/designations are unioned without duplicates.
+    """
+    first = results[0]
+
+    def first_value(field: str):
+        return next((getattr(r, field) for r in results if getattr(r, field)), None)
+
+    summaries = _dedupe_terms([[r.domain_knowledge] for r in results if r.domain_knowledge])
+    return ResumeParseResult(
+        is_resume=first.is_resume,
+        document_type=first.document_type,
+        error_reason=first.error_reason,
+        name=first_value("name"),
+        email=first_value("email"),
+        phone=first_value("phone"),
+        skills=_dedupe_terms([r.skills for r in results]),
+        designations=_dedupe_terms([r.designations for r in results]),
+        domain_knowledge=" ".join(summaries) or None,
+    )
+
+
+async def _request_parse_from_openai(resume_text: str) -> ParsedCandidateData:
+    """
+    Validate and parse candidate resume text with OpenAI.
+    Resumes within RESUME_TOKEN_BUDGET take a single call; longer ones (when
+    RESUME_CHUNKED_PARSING is on) are split into sections parsed concurrently and merged.
+    """
+    if settings.RESUME_CHUNKED_PARSING:
+        token_budget = max(settings.RESUME_TOKEN_BUDGET, settings.RESUME_CHUNK_TOKENS * settings.RESUME_MAX_CHUNKS)
+    else:
+        token_budget = settings.RESUME_TOKEN_BUDGET
+
+    condensed = condense_resume_text(resume_text, token_budget)
+    logger.info(
+        f"Condensed resume text from {condensed.original_tokens} to {condensed.condensed_tokens} tokens "
+        f"(saved {condensed.saved_tokens})"
+    )
+
+    if condensed.condensed_tokens <= settings.RESUME_TOKEN_BUDGET:
+        result = await _parse_text_with_openai(condensed.text)
+    else:
+        chunks = split_into_chunks(condensed.text, settings.RESUME_CHUNK_TOKENS, settings.RESUME_MAX_CHUNKS)
+        logger.info(f"Parsing long resume in {len(chunks)} chunks")
+        results = await asyncio.gather(
+            *(_parse_text_with_openai(chunk, part=i + 1, parts=len(chunks)) for i, chunk in enumerate(chunks))
+        )
+        result = merge_parse_results(list(results))
+
+    # Check if document is a valid resume
+    if not result.is_resume:
+        logger.info(f"Document rejected as {result.document_type}: {result.error_reason}")
+        raise ResumeParseError("Document is not a valid resume")
+
+    return ParsedCandidateData(**result.model_dump(include=set(ParsedCandidateData.model_fields)))
+
+
+async def _parse_text_with_openai(resume_text: str, part: int = 1, parts: int = 1) -> ResumeParseResult:
+    """
+    Run the validate-and-extract prompt on resume text (or one part of it) in a single call.
+
+    Raises:
+        ResumeParseError: If the reply is still invalid after local repair and one re-ask
+        ValueError: On OpenAI API errors
+    """
+    if parts > 1:
+        document_label = f"Document Text (part {part} of {parts}; extract only what appears in this part"
+        if part > 1:
+            document_label += ", and treat it as part of a resume since the document was already identified as one"
+        document_label += "):"
+    else:
+        document_label = "Document Text:"
+
     prompt = f"""
 You are a professional resume parser. Your task has TWO steps:
 
@@ -37,7 +291,7 @@ STEP 2: If it IS a resume, EXTRACT the following information:
 5. designations: Array of ALL job titles/positions the candidate has held throughout their career
 6. domain_knowledge: Summary of the candidate's domain expertise and industry knowledge
 
-Document Text:
+{document_label}
 {resume_text}
 
 Return a JSON object with this EXACT format:
@@ -56,56 +310,48 @@ Return a JSON object with this EXACT format:
 If is_resume is false, only fill is_resume, document_type, and error_reason. Other fields should be null/empty.
 If is_resume is true, fill all fields with extracted data.
 """
+    logger.debug(f"OpenAI resume parsing prompt:\n{prompt}")
+
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
 
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional resume validator and parser that first checks if a document is a resume, then extracts structured data from valid resumes.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+        response = await _create_chat_completion(
+            messages=messages,
             temperature=0.2,
             max_tokens=1200,
+            **_response_format_kwargs(),
         )
+        content = response.choices[0].message.content or ""
 
-        content = response.choices[0].message.content.strip()
-
-        # Remove markdown code blocks if present
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
-
-        result = json.loads(content)
-
-        # Check if document is a valid resume
-        is_resume = result.get("is_resume", False)
-        if not is_resume:
-            document_type = result.get("document_type", "unknown")
-            error_reason = result.get("error_reason", "Document does not appear to be a resume")
-            raise ValueError(f"Document is not a valid resume")
-
-        # Extract candidate data
-        candidate_data = {
-            "name": result.get("name"),
-            "email": result.get("email"),
-            "phone": result.get("phone"),
-            "skills": result.get("skills", []),
-            "designations": result.get("designations", []),
-            "domain_knowledge": result.get("domain_knowledge"),
-        }
+        try:
+            result = _load_parse_result(content)
+        except (json.JSONDecodeError, ValidationError) as e:
+            # One targeted re-ask of the LLM step only, with the validation error as feedback
+            logger.warning(f"OpenAI reply failed validation, asking for a corrected reply: {e}")
+            messages += [
+                {"role": "assistant", "content": content},
+                {
+                    "role": "user",
+                    "content": f"Your reply was not valid JSON in the required format ({e}). Return only the corrected JSON object.",
+                },
+            ]
+            response = await _create_chat_completion(
+                messages=messages,
+                temperature=0,
+                max_tokens=1200,
+                **_response_format_kwargs(),
+            )
+            try:
+                result = _load_parse_result(response.choices[0].message.content or "")
+            except (json.JSONDecodeError, ValidationError) as retry_error:
+                logger.error(f"Failed to parse OpenAI response as JSON: {retry_error}")
+                raise ResumeParseError(f"Invalid JSON response from OpenAI: {str(retry_error)}")
 
-        return ParsedCandidateData(**candidate_data)
+        return result
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse OpenAI response as JSON: {e}")
-        raise ValueError(f"Invalid JSON response from OpenAI: {str(e)}")
     except ValueError:
         # Re-raise validation errors as-is
         raise
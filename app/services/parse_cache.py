@@ -0,0 +1,152 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete
+from sqlalchemy.dialects.postgresql import insert
+from app.core.config import settings
+from app.models.parse_cache import ParsedResumeCache
+from app.schemas.candidate import ParsedCandidateData
+import hashlib
+import logging
+import re
+import time
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_resume_text(resume_text: str) -> str:
+    """Normalize extracted text so cosmetic differences (PDF vs DOCX export) hash the same"""
+    text = unicodedata.normalize("NFKC", resume_text)
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def make_cache_key(resume_text: str, prompt_version: str, model: str) -> str:
+    """Build the cache key from normalized text, prompt version and model name"""
+    payload = f"{prompt_version}\x00{model}\x00{normalize_resume_text(resume_text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ParseResultCache:
+    """
+    Two-tier cache for OpenAI parse results.
+    Tier 1 is an in-process LRU with TTL; tier 2 is the parsed_resume_cache table,
+    consulted only when a database session is supplied.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def _get_local(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return data
+
+    def _set_local(self, key: str, data: dict) -> None:
+        self._entries[key] = (time.monotonic(), data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str, db: AsyncSession | None = None) -> ParsedCandidateData | None:
+        """Look up a parse result, promoting database hits into the LRU"""
+        data = self._get_local(key)
+        if data is not None:
+            self.memory_hits += 1
+            return ParsedCandidateData(**data)
+
+        if db is not None:
+            try:
+                # Savepoint keeps a cache failure from poisoning the caller's transaction
+                async with db.begin_nested():
+                    cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+                    result = await db.execute(
+                        select(ParsedResumeCache.parsed_data).where(
+                            ParsedResumeCache.cache_key == key,
+                            ParsedResumeCache.created_at >= cutoff,
+                        )
+                    )
+                    data = result.scalar_one_or_none()
+                    if data is not None:
+                        await db.execute(
+                            update(ParsedResumeCache)
+                            .where(ParsedResumeCache.cache_key == key)
+                            .values(
+                                hit_count=ParsedResumeCache.hit_count + 1,
+                                last_hit_at=datetime.now(timezone.utc),
+                            )
+                        )
+                if data is not None:
+                    self._set_local(key, data)
+                    self.db_hits += 1
+                    return ParsedCandidateData(**data)
+            except Exception as e:
+                logger.warning(f"Parse cache lookup failed for key {key[:12]}: {e}")
+
+        self.misses += 1
+        return None
+
+    async def set(
+        self,
+        key: str,
+        parsed_data: ParsedCandidateData,
+        model: str,
+        prompt_version: str,
+        db: AsyncSession | None = None,
+    ) -> None:
+        """Store a parse result in both tiers and drop expired database rows"""
+        data = parsed_data.model_dump()
+        self._set_local(key, data)
+
+        if db is None:
+            return
+
+        try:
+            async with db.begin_nested():
+                await db.execute(
+                    insert(ParsedResumeCache)
+                    .values(
+                        cache_key=key,
+                        model=model,
+                        prompt_version=prompt_version,
+                        parsed_data=data,
+                        hit_count=0,
+                    )
+                    .on_conflict_do_nothing(index_elements=[ParsedResumeCache.cache_key])
+                )
+                cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+                await db.execute(delete(ParsedResumeCache).where(ParsedResumeCache.created_at < cutoff))
+        except Exception as e:
+            logger.warning(f"Parse cache store failed for key {key[:12]}: {e}")
+
+    def clear(self) -> None:
+        """Drop all in-process entries (database rows are kept)"""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for monitoring"""
+        lookups = self.memory_hits + self.db_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.db_hits) / lookups if lookups else 0.0,
+        }
+
+
+parse_cache = ParseResultCache(
+    max_entries=settings.PARSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PARSE_CACHE_TTL_SECONDS,
+)
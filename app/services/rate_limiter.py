@@ -0,0 +1,213 @@
+from app.core.config import settings
+import redis
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Adaptive rate factor bounds (fraction of the configured quota actually used)
+MIN_RATE_FACTOR = 0.1
+MAX_RATE_FACTOR = 1.0
+RATE_LIMITED_DECREASE = 0.5  # Multiplicative decrease on 429
+NEAR_LIMIT_DECREASE = 0.9  # Gentle decrease when headers show little quota left
+SUCCESS_INCREASE = 0.05  # Additive increase per successful call
+NEAR_LIMIT_RATIO = 0.05
+
+# Atomically refill and take from both the request and token buckets.
+# Returns {granted, wait_ms}. Nothing is consumed unless both buckets have capacity.
+_TAKE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local capacities = {tonumber(ARGV[2]), tonumber(ARGV[3])}
+local amounts = {1, tonumber(ARGV[4])}
+local levels = {}
+local wait = 0
+
+local paused_until = tonumber(redis.call('GET', KEYS[3]) or '0')
+if paused_until > now then
+    return {0, paused_until - now}
+end
+
+for i = 1, 2 do
+    local data = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local capacity = capacities[i]
+    local rate = capacity / 60000.0
+    local tokens = tonumber(data[1]) or capacity
+    local ts = tonumber(data[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    local amount = math.min(amounts[i], capacity)
+    if tokens < amount then
+        wait = math.max(wait, math.ceil((amount - tokens) / rate))
+    end
+end
+
+local granted = 0
+if wait == 0 then
+    granted = 1
+    for i = 1, 2 do
+        levels[i] = levels[i] - math.min(amounts[i], capacities[i])
+    end
+end
+
+for i = 1, 2 do
+    redis.call('HSET', KEYS[i], 'tokens', tostring(levels[i]), 'ts', tostring(now))
+    redis.call('PEXPIRE', KEYS[i], 120000)
+end
+return {granted, wait}
+"""
+
+
+class _LocalBackend:
+    """In-process token buckets, used when REDIS_URL is not configured"""
+
+    def __init__(self):
+        self._levels: dict[str, tuple[float, float]] = {}
+        self._paused_until = 0.0
+        self.factor = MAX_RATE_FACTOR
+
+    async def take(self, rpm: float, tpm: float, tokens: int) -> float:
+        # No awaits below, so the check-and-take is atomic on the event loop
+        now = time.monotonic()
+        if self._paused_until > now:
+            return self._paused_until - now
+
+        wait = 0.0
+        levels = {}
+        for name, capacity, amount in (("requests", rpm, 1), ("tokens", tpm, tokens)):
+            rate = capacity / 60.0
+            level, ts = self._levels.get(name, (capacity, now))
+            level = min(capacity, level + (now - ts) * rate)
+            amount = min(amount, capacity)
+            levels[name] = (level, amount)
+            if level < amount:
+                wait = max(wait, (amount - level) / rate)
+
+        for name, (level, amount) in levels.items():
+            self._levels[name] = (level - amount if wait == 0 else level, now)
+        return wait
+
+    async def get_factor(self) -> float:
+        return self.factor
+
+    async def set_factor(self, factor: float) -> None:
+        self.factor = factor
+
+    async def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class _RedisBackend:
+    """
+    Token buckets shared through Redis by every API and Celery worker.
+
+    Uses one synchronous client, called from a thread: an asyncio client is bound to
+    the loop it was created on, and Celery runs each task in a new one.
+    """
+
+    KEY_PREFIX = "openai:ratelimit"
+
+    def __init__(self, url: str):
+        # Short timeouts so a stalled Redis falls back to the in-process limiter instead of hanging
+        self._client = redis.Redis.from_url(url, socket_connect_timeout=2, socket_timeout=2)
+
+    async def take(self, rpm: float, tpm: float, tokens: int) -> float:
+        granted, wait_ms = await asyncio.to_thread(
+            self._client.eval,
+            _TAKE_SCRIPT,
+            3,
+            f"{self.KEY_PREFIX}:requests",
+            f"{self.KEY_PREFIX}:tokens",
+            f"{self.KEY_PREFIX}:paused_until",
+            int(time.time() * 1000),
+            rpm,
+            tpm,
+            tokens,
+        )
+        return 0.0 if int(granted) else int(wait_ms) / 1000
+
+    async def get_factor(self) -> float:
+        value = await asyncio.to_thread(self._client.get, f"{self.KEY_PREFIX}:factor")
+        return float(value) if value is not None else MAX_RATE_FACTOR
+
+    async def set_factor(self, factor: float) -> None:
+        await asyncio.to_thread(self._client.set, f"{self.KEY_PREFIX}:factor", factor, ex=3600)
+
+    async def pause(self, seconds: float) -> None:
+        paused_until = int((time.time() + seconds) * 1000)
+        await asyncio.to_thread(
+            self._client.set, f"{self.KEY_PREFIX}:paused_until", paused_until, px=int(seconds * 1000)
+        )
+
+
+class OpenAIRateLimiter:
+    """
+    Token-bucket limiter on requests/min and tokens/min for OpenAI calls.
+    The effective rate is scaled by an adaptive factor: it is cut on 429s or when
+    response headers show the quota running low, and recovers on successful calls.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, redis_url: str | None = None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._local = _LocalBackend()
+        self._backend = _RedisBackend(redis_url) if redis_url else self._local
+
+    async def _call_backend(self, method: str, *args):
+        try:
+            return await getattr(self._backend, method)(*args)
+        except Exception as e:
+            # Keep parsing working if Redis is unavailable
+            logger.warning(f"Shared rate limiter unavailable, using in-process limiter: {e}")
+            return await getattr(self._local, method)(*args)
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait until a request of estimated_tokens fits within the current quota"""
+        while True:
+            factor = await self._call_backend("get_factor")
+            wait = await self._call_backend(
+                "take",
+                self.requests_per_minute * factor,
+                self.tokens_per_minute * factor,
+                estimated_tokens,
+            )
+            if wait <= 0:
+                return
+            logger.debug(f"OpenAI rate limiter waiting {wait:.2f}s (factor {factor:.2f})")
+            await asyncio.sleep(wait)
+
+    async def record_success(self, headers=None) -> None:
+        """Speed back up after a successful call, or slow down if headers show little quota left"""
+        factor = await self._call_backend("get_factor")
+        if headers is not None and self._near_limit(headers):
+            factor = max(MIN_RATE_FACTOR, factor * NEAR_LIMIT_DECREASE)
+        else:
+            factor = min(MAX_RATE_FACTOR, factor + SUCCESS_INCREASE)
+        await self._call_backend("set_factor", factor)
+
+    async def record_rate_limited(self, retry_after: float | None = None) -> None:
+        """Back off after a 429: cut the rate and pause all callers for retry_after"""
+        factor = await self._call_backend("get_factor")
+        factor = max(MIN_RATE_FACTOR, factor * RATE_LIMITED_DECREASE)
+        await self._call_backend("set_factor", factor)
+        await self._call_backend("pause", retry_after or 1.0)
+        logger.warning(f"OpenAI rate limit hit, reducing rate factor to {factor:.2f}")
+
+    @staticmethod
+    def _near_limit(headers) -> bool:
+        for kind in ("requests", "tokens"):
+            try:
+                limit = int(headers.get(f"x-ratelimit-limit-{kind}"))
+                remaining = int(headers.get(f"x-ratelimit-remaining-{kind}"))
+            except (TypeError, ValueError):
+                continue
+            if limit and remaining / limit < NEAR_LIMIT_RATIO:
+                return True
+        return False
+
+
+openai_rate_limiter = OpenAIRateLimiter(
+    requests_per_minute=settings.OPENAI_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.OPENAI_TOKENS_PER_MINUTE,
+    redis_url=settings.REDIS_URL,
+)
@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from app.core.config import settings
+from app.services.contact_extractor import EMAIL_RE, iter_phone_numbers
+from app.services.resume_preprocessor import SECTION_PRIORITIES
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+_PROFILE_RE = re.compile(r"linkedin\.com/|github\.com/", re.IGNORECASE)
+_DATE_RANGE_RE = re.compile(
+    r"\b(?:19|20)\d{2}\s*(?:-|–|—|to)\s*(?:(?:19|20)\d{2}|present|current|now)\b", re.IGNORECASE
+)
+
+# Phrases typical of documents uploaded by mistake, with their penalty
+NEGATIVE_PHRASES = {
+    # Invoices / financial documents
+    "invoice": 2.0,
+    "invoice number": 2.0,
+    "bill to": 2.0,
+    "subtotal": 2.0,
+    "amount due": 2.0,
+    "total due": 2.0,
+    "payment terms": 2.0,
+    "purchase order": 2.0,
+    "vat": 1.0,
+    "quantity": 1.0,
+    "unit price": 2.0,
+    # Job descriptions
+    "job description": 2.0,
+    "we are looking for": 2.0,
+    "about the role": 1.5,
+    "what you'll do": 1.5,
+    "what you will do": 1.5,
+    "the ideal candidate": 2.0,
+    "apply now": 2.0,
+    "how to apply": 2.0,
+    "equal opportunity employer": 2.0,
+    "benefits": 0.5,
+    "requirements": 0.5,
+}
+_NEGATIVE_RE = re.compile(
+    r"\b(" + "|".join(re.escape(phrase) for phrase in sorted(NEGATIVE_PHRASES, key=len, reverse=True)) + r")\b"
+)
+
+
+@dataclass
+class ClassificationResult:
+    label: str  # resume, not_resume or ambiguous
+    score: float
+    signals: dict = field(default_factory=dict)
+
+
+@dataclass
+class ClassifierStats:
+    checked: int = 0
+    rejected: int = 0
+    ambiguous: int = 0
+
+    def as_dict(self) -> dict:
+        return {"checked": self.checked, "rejected": self.rejected, "ambiguous": self.ambiguous}
+
+
+classifier_stats = ClassifierStats()
+
+
+def classify_document(text: str) -> ClassificationResult:
+    """
+    Score extracted text for how resume-like it is.
+    Resume section headings, contact details and employment date ranges add to the
+    score; invoice and job-description phrases subtract from it. The score is compared
+    with RESUME_CLASSIFIER_REJECT_SCORE and RESUME_CLASSIFIER_ACCEPT_SCORE.
+    """
+    lowered = text.lower()
+    headings = {
+        line.strip().rstrip(":").lower()
+        for line in text.splitlines()
+        if line.strip().rstrip(":").lower() in SECTION_PRIORITIES
+    }
+
+    signals = {
+        "headings": len(headings),
+        "email": bool(EMAIL_RE.search(text)),
+        "phone": next(iter_phone_numbers(text), None) is not None,
+        "profile_link": bool(_PROFILE_RE.search(text)),
+        "date_ranges": len(_DATE_RANGE_RE.findall(text)),
+        "negative_phrases": sorted(set(_NEGATIVE_RE.findall(lowered))),
+    }
+
+    score = min(len(headings), 4) * 1.5
+    score += 1.0 if signals["email"] else 0.0
+    score += 1.0 if signals["phone"] else 0.0
+    score += 1.0 if signals["profile_link"] else 0.0
+    score += min(signals["date_ranges"], 3) * 0.5
+    score -= sum(NEGATIVE_PHRASES[phrase] for phrase in signals["negative_phrases"])
+
+    if score <= settings.RESUME_CLASSIFIER_REJECT_SCORE:
+        label = "not_resume"
+    elif score >= settings.RESUME_CLASSIFIER_ACCEPT_SCORE:
+        label = "resume"
+    else:
+        label = "ambiguous"
+
+    return ClassificationResult(label=label, score=score, signals=signals)
+
+
+def is_obvious_non_resume(text: str) -> bool:
+    """Classify text and record the outcome; True means the LLM call can be skipped"""
+    result = classify_document(text)
+    classifier_stats.checked += 1
+
+    if result.label == "not_resume":
+        classifier_stats.rejected += 1
+        logger.info(
+            f"Local classifier rejected document (score {result.score:.1f}, signals {result.signals}); "
+            f"OpenAI calls avoided so far: {classifier_stats.rejected}"
+        )
+        return True
+
+    if result.label == "ambiguous":
+        classifier_stats.ambiguous += 1
+    return False
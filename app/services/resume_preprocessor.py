@@ -0,0 +1,231 @@
+from collections import Counter
+from dataclasses import dataclass
+from app.utils.file_handler import PAGE_BREAK
+import math
+import re
+
+# Section headings, by priority when the text has to be trimmed (lower is kept longer)
+SECTION_PRIORITIES = {
+    "experience": 0,
+    "work experience": 0,
+    "professional experience": 0,
+    "employment": 0,
+    "employment history": 0,
+    "work history": 0,
+    "career history": 0,
+    "contact": 0,
+    "contact information": 0,
+    "skills": 1,
+    "technical skills": 1,
+    "core competencies": 1,
+    "summary": 1,
+    "professional summary": 1,
+    "profile": 1,
+    "objective": 2,
+    "education": 2,
+    "certifications": 2,
+    "projects": 3,
+    "achievements": 3,
+    "awards": 3,
+    "languages": 3,
+    "publications": 4,
+    "conferences": 4,
+    "volunteer": 4,
+    "volunteering": 4,
+    "interests": 5,
+    "hobbies": 5,
+    "references": 5,
+}
+
+_PAGE_NUMBER_RE = re.compile(r"^(page\s*)?[-–—]?\s*\d{1,3}\s*(of\s*\d{1,3})?\s*[-–—]?$", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+@dataclass
+class CondensedResume:
+    text: str
+    original_tokens: int
+    condensed_tokens: int
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.condensed_tokens
+
+
+def count_tokens(text: str) -> int:
+    """
+    Estimate the number of model tokens in text.
+    Words and punctuation marks each count as one token, with long words split
+    roughly every 4 characters, which tracks the OpenAI tokenizers closely for
+    English resume text without needing the tokenizer files at runtime.
+    """
+    return sum(math.ceil(len(piece) / 4) for piece in _TOKEN_RE.findall(text))
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of spaces/tabs and blank lines, keeping form-feed page breaks"""
+    pages = []
+    for page in text.split(PAGE_BREAK):
+        lines = [re.sub(r"[ \t\u00a0]+", " ", line).strip() for line in page.splitlines()]
+        pages.append(re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip())
+    return PAGE_BREAK.join(pages).strip()
+
+
+def _edge_positions(lines: list[str], edge_lines: int) -> dict[int, list[tuple[str, int]]]:
+    """
+    Map the indexes of the first and last edge_lines non-empty lines of a page to
+    their positions, ("top", n) counting from the top or ("bottom", n) from the bottom
+    """
+    filled = [index for index, line in enumerate(lines) if line]
+    positions = {}
+    for offset, index in enumerate(filled[:edge_lines]):
+        positions.setdefault(index, []).append(("top", offset))
+    for offset, index in enumerate(reversed(filled[-edge_lines:])):
+        positions.setdefault(index, []).append(("bottom", offset))
+    return positions
+
+
+def drop_boilerplate(text: str, min_repeats: int = 3, edge_lines: int = 3) -> str:
+    """
+    Remove page numbers and per-page headers/footers, then join the pages.
+
+    Pages are separated by form feeds (see extract_text_from_pdf). Only the first and
+    last edge_lines lines of each page are considered: a page-number line there is
+    dropped, and a short line at the same position from the top or bottom of at least
+    min_repeats pages (or of every page, for shorter documents) keeps only its first
+    occurrence. Text without page breaks, such as DOCX, is returned unchanged.
+    """
+    pages = [page.split("\n") for page in text.split(PAGE_BREAK)]
+    if len(pages) < 2:
+        return text
+
+    edges = [_edge_positions(lines, edge_lines) for lines in pages]
+    position_counts = Counter()
+    for lines, positions in zip(pages, edges):
+        for index, line_positions in positions.items():
+            if len(lines[index]) <= 80:
+                position_counts.update((lines[index].lower(), position) for position in line_positions)
+    repeats_needed = max(2, min(min_repeats, len(pages)))
+
+    seen = set()
+    kept = []
+    for lines, positions in zip(pages, edges):
+        for index, line in enumerate(lines):
+            if index in positions:
+                if _PAGE_NUMBER_RE.match(line):
+                    continue
+                key = line.lower()
+                if any(position_counts[(key, position)] >= repeats_needed for position in positions[index]):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+            kept.append(line)
+    return "\n".join(kept)
+
+
+def _heading_priority(line: str) -> int | None:
+    """Return the trim priority if the line looks like a section heading"""
+    heading = line.strip().rstrip(":").lower()
+    if len(heading) > 40:
+        return None
+    return SECTION_PRIORITIES.get(heading)
+
+
+def _split_sections(text: str) -> list[tuple[int, list[str]]]:
+    """Split text into (priority, lines) sections; the leading block holds contact details"""
+    sections = [(0, [])]
+    for line in text.split("\n"):
+        priority = _heading_priority(line)
+        if priority is not None:
+            sections.append((priority, [line]))
+        else:
+            sections[-1][1].append(line)
+    return sections
+
+
+def trim_to_budget(text: str, token_budget: int) -> str:
+    """
+    Trim text to token_budget while keeping contact and experience content.
+    Lowest-priority sections are dropped first, then remaining sections lose their
+    trailing lines, lowest priority first.
+    """
+    if count_tokens(text) <= token_budget:
+        return text
+
+    sections = _split_sections(text)
+    total = sum(count_tokens(line) for _, lines in sections for line in lines)
+
+    # Trim order: lowest priority first, later sections before earlier ones.
+    # The leading contact block and experience sections (priority 0) go last.
+    order = sorted(range(len(sections)), key=lambda i: (-sections[i][0], -i))
+
+    # First drop whole optional sections
+    for index in order:
+        if total <= token_budget:
+            break
+        priority, lines = sections[index]
+        if priority == 0:
+            continue
+        total -= sum(count_tokens(line) for line in lines)
+        lines.clear()
+
+    # Still over budget: cut trailing lines of the remaining sections
+    for index in order:
+        lines = sections[index][1]
+        while lines and total > token_budget:
+            total -= count_tokens(lines.pop())
+        if total <= token_budget:
+            break
+
+    return "\n".join(line for _, lines in sections for line in lines)
+
+
+def _split_lines(lines: list[str], chunk_tokens: int, at_headings: bool) -> list[list[str]]:
+    chunks = []
+    current = []
+    current_tokens = 0
+    for line in lines:
+        tokens = count_tokens(line)
+        at_heading = at_headings and _heading_priority(line) is not None and current_tokens >= chunk_tokens // 2
+        if current and (current_tokens + tokens > chunk_tokens or at_heading):
+            chunks.append(current)
+            current = []
+            current_tokens = 0
+        current.append(line)
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_into_chunks(text: str, chunk_tokens: int, max_chunks: int | None = None) -> list[str]:
+    """
+    Split text into chunks of about chunk_tokens, breaking on line boundaries and
+    preferring to start a new chunk at a section heading once a chunk is half full.
+
+    At most max_chunks chunks are returned: if heading breaks produce more, the text
+    is split by size alone, and any remaining excess is merged into the smallest
+    neighbouring chunks.
+    """
+    lines = text.split("\n")
+    chunks = _split_lines(lines, chunk_tokens, at_headings=True)
+    if max_chunks is not None and len(chunks) > max_chunks:
+        chunks = _split_lines(lines, chunk_tokens, at_headings=False)
+        sizes = [sum(count_tokens(line) for line in chunk) for chunk in chunks]
+        while len(chunks) > max(max_chunks, 1):
+            index = min(range(len(chunks) - 1), key=lambda i: sizes[i] + sizes[i + 1])
+            chunks[index:index + 2] = [chunks[index] + chunks[index + 1]]
+            sizes[index:index + 2] = [sizes[index] + sizes[index + 1]]
+    return ["\n".join(chunk) for chunk in chunks]
+
+
+def condense_resume_text(resume_text: str, token_budget: int) -> CondensedResume:
+    """Normalize, de-boilerplate and budget-trim resume text before it goes into the prompt"""
+    original_tokens = count_tokens(resume_text)
+    text = drop_boilerplate(normalize_whitespace(resume_text))
+    text = trim_to_budget(text, token_budget)
+    return CondensedResume(
+        text=text,
+        original_tokens=original_tokens,
+        condensed_tokens=count_tokens(text),
+    )
@@ -0,0 +1,310 @@
+from collections import OrderedDict
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.candidate import Candidate
+from app.services.boolean_query import Term, Not, And, Node
+from app.services.candidate_search import TRIGRAM_MIN_TERM_LENGTH
+from app.utils.normalization import normalize_terms
+from datetime import timedelta
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Sparse postings are kept as sets and promoted to int bitsets once a bitset is smaller
+SPARSE_BYTES_PER_ID = 64
+MATCH_CACHE_SIZE = 1024
+# Overlap between incremental refreshes so writes committed around the watermark are not missed
+REFRESH_OVERLAP = timedelta(seconds=5)
+
+
+def _bitset_from_ids(ids) -> int:
+    """Build an int bitset (bit n set for candidate id n) from an iterable of ids"""
+    ids = list(ids)
+    if not ids:
+        return 0
+    buffer = bytearray(max(ids) // 8 + 1)
+    for candidate_id in ids:
+        buffer[candidate_id >> 3] |= 1 << (candidate_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _page_of_ids(bits: int, skip: int, limit: int) -> list[int]:
+    """Ids of the set bits, highest (newest) first, after skipping the first skip"""
+    if not bits or limit <= 0:
+        return []
+    word_count = (bits.bit_length() + 63) // 64
+    words = memoryview(bits.to_bytes(word_count * 8, "little")).cast("Q")
+    ids = []
+    for index in range(word_count - 1, -1, -1):
+        word = words[index]
+        if not word:
+            continue
+        count = word.bit_count()
+        if skip >= count:
+            skip -= count
+            continue
+        while word and len(ids) < limit:
+            bit = word.bit_length() - 1
+            word ^= 1 << bit
+            if skip:
+                skip -= 1
+            else:
+                ids.append(index * 64 + bit)
+        if len(ids) >= limit:
+            break
+    return ids
+
+
+class SkillIndex:
+    """
+    In-process inverted index from canonical skill/designation terms to candidate ids,
+    for boolean skill search without a database round trip.
+
+    Postings are sets of ids while sparse and int bitsets once dense. Queries are
+    evaluated on bitsets with &, | and ~, matching terms the same way the SQL path
+    does (substring, or prefix for terms shorter than three characters). Candidates
+    written by this process are applied immediately; refresh() picks up writes from
+    Celery workers and other API processes, and periodically deletes via reconcile().
+    """
+
+    def __init__(self):
+        self.ready = False
+        self._reset()
+
+    def _reset(self):
+        self._postings: dict[str, set[int] | int] = {}
+        self._candidate_terms: dict[int, frozenset[str]] = {}
+        self._candidate_status: dict[int, str] = {}
+        self._status_bits: dict[str, int] = {}
+        self._all = 0
+        self._max_id = 0
+        # Query term -> vocabulary terms it matches; kept current as terms are added
+        self._matches: OrderedDict[str, list[str]] = OrderedDict()
+        self._watermark = None
+        # While loading, ids are collected in sets and turned into bitsets once at the end
+        self._loading = False
+        self._loading_status: dict[str, set[int]] = {}
+
+    # Maintenance
+
+    def _add_posting(self, term: str, candidate_id: int) -> None:
+        posting = self._postings.get(term)
+        if posting is None:
+            self._postings[term] = {candidate_id}
+            for text, matched in self._matches.items():
+                if self._term_matches(text, term):
+                    matched.append(term)
+        elif isinstance(posting, int):
+            self._postings[term] = posting | (1 << candidate_id)
+        else:
+            posting.add(candidate_id)
+            if not self._loading and len(posting) * SPARSE_BYTES_PER_ID > self._max_id // 8:
+                self._postings[term] = _bitset_from_ids(posting)
+
+    def _remove_posting(self, term: str, candidate_id: int) -> None:
+        posting = self._postings.get(term)
+        if isinstance(posting, int):
+            self._postings[term] = posting & ~(1 << candidate_id)
+        elif posting is not None:
+            posting.discard(candidate_id)
+
+    def _set_status(self, candidate_id: int, status: str | None) -> None:
+        old_status = self._candidate_status.pop(candidate_id, None)
+        if old_status is not None:
+            self._status_bits[old_status] &= ~(1 << candidate_id)
+        if status is not None:
+            self._candidate_status[candidate_id] = status
+            self._status_bits[status] = self._status_bits.get(status, 0) | (1 << candidate_id)
+
+    def _apply(self, candidate_id: int, status, skills, designations) -> None:
+        self._max_id = max(self._max_id, candidate_id)
+        terms = frozenset(normalize_terms(skills if isinstance(skills, list) else None)
+                          + normalize_terms(designations if isinstance(designations, list) else None))
+        old_terms = self._candidate_terms.get(candidate_id, frozenset())
+        for term in old_terms - terms:
+            self._remove_posting(term, candidate_id)
+        for term in terms - old_terms:
+            self._add_posting(term, candidate_id)
+        self._candidate_terms[candidate_id] = terms
+        status = getattr(status, "value", status)
+        if self._loading:
+            self._candidate_status[candidate_id] = status
+            self._loading_status.setdefault(status, set()).add(candidate_id)
+            return
+        self._set_status(candidate_id, status)
+        self._all |= 1 << candidate_id
+
+    def _finish_loading(self) -> None:
+        for term, posting in self._postings.items():
+            if len(posting) * SPARSE_BYTES_PER_ID > self._max_id // 8:
+                self._postings[term] = _bitset_from_ids(posting)
+        self._status_bits = {status: _bitset_from_ids(ids) for status, ids in self._loading_status.items()}
+        self._all = _bitset_from_ids(self._candidate_terms)
+        self._loading_status = {}
+        self._loading = False
+
+    def update_candidate(self, candidate: Candidate) -> None:
+        """Apply a committed candidate write; no-op until the index is loaded"""
+        if self.ready:
+            self._apply(candidate.id, candidate.status, candidate.skills, candidate.designations)
+
+    def update_status(self, candidate_id: int, status) -> None:
+        """Apply a committed status-only change; no-op until the index is loaded"""
+        if self.ready and candidate_id in self._candidate_status:
+            self._set_status(candidate_id, getattr(status, "value", status))
+
+    def remove_candidate(self, candidate_id: int) -> None:
+        """Drop a deleted candidate; no-op until the index is loaded"""
+        if not self.ready:
+            return
+        for term in self._candidate_terms.pop(candidate_id, frozenset()):
+            self._remove_posting(term, candidate_id)
+        self._set_status(candidate_id, None)
+        self._all &= ~(1 << candidate_id)
+
+    async def _read_candidates(self, db: AsyncSession, since=None) -> int:
+        query = select(Candidate.id, Candidate.status, Candidate.skills, Candidate.designations)
+        if since is not None:
+            query = query.where(Candidate.updated_at >= since)
+        count = 0
+        result = await db.stream(query.execution_options(yield_per=5000))
+        async for candidate_id, status, skills, designations in result:
+            self._apply(candidate_id, status, skills, designations)
+            count += 1
+        return count
+
+    async def load(self, db: AsyncSession) -> None:
+        """Build the index from scratch"""
+        started = time.perf_counter()
+        watermark = (await db.execute(select(func.now()))).scalar_one()
+        self.ready = False
+        self._reset()
+        # Size postings against the final id range so they are not promoted too early
+        self._max_id = (await db.execute(select(func.coalesce(func.max(Candidate.id), 0)))).scalar_one()
+        self._loading = True
+        count = await self._read_candidates(db)
+        self._finish_loading()
+        self._watermark = watermark
+        self._reconciled_at = time.monotonic()
+        self.ready = True
+        logger.info(
+            f"Skill index loaded: {count} candidates, {len(self._postings)} terms "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """
+        Apply candidates updated since the last load/refresh, e.g. by Celery workers,
+        and every SKILL_INDEX_RECONCILE_SECONDS drop candidates deleted elsewhere
+        """
+        if not self.ready:
+            await self.load(db)
+            return
+        watermark = (await db.execute(select(func.now()))).scalar_one()
+        count = await self._read_candidates(db, since=self._watermark - REFRESH_OVERLAP)
+        self._watermark = watermark
+        if count:
+            logger.debug(f"Skill index refreshed {count} candidates")
+        if time.monotonic() - self._reconciled_at >= settings.SKILL_INDEX_RECONCILE_SECONDS:
+            await self.reconcile(db)
+
+    async def reconcile(self, db: AsyncSession) -> int:
+        """
+        Drop indexed candidates that no longer exist in the database. Only ids indexed
+        before the id scan starts are checked: candidates are indexed after they commit,
+        so each of those is either in the scan or was deleted.
+
+        Returns:
+            int: Number of candidates dropped
+        """
+        indexed = self._all
+        result = await db.stream(select(Candidate.id).execution_options(yield_per=50000))
+        existing = _bitset_from_ids([candidate_id async for candidate_id in result.scalars()])
+        stale = indexed & ~existing
+        removed = _page_of_ids(stale, 0, stale.bit_count())
+        for candidate_id in removed:
+            self.remove_candidate(candidate_id)
+        self._reconciled_at = time.monotonic()
+        if removed:
+            logger.info(f"Skill index dropped {len(removed)} deleted candidates")
+        return len(removed)
+
+    # Queries
+
+    @staticmethod
+    def _term_matches(text: str, term: str) -> bool:
+        if len(text) < TRIGRAM_MIN_TERM_LENGTH:
+            return term.startswith(text)
+        return text in term
+
+    def _term_bits(self, text: str) -> int:
+        matched = self._matches.get(text)
+        if matched is None:
+            matched = [term for term in self._postings if self._term_matches(text, term)]
+            self._matches[text] = matched
+            if len(self._matches) > MATCH_CACHE_SIZE:
+                self._matches.popitem(last=False)
+        else:
+            self._matches.move_to_end(text)
+
+        bits = 0
+        sparse_ids = set()
+        for term in matched:
+            posting = self._postings[term]
+            if isinstance(posting, int):
+                bits |= posting
+            else:
+                sparse_ids.update(posting)
+        return bits | _bitset_from_ids(sparse_ids)
+
+    def _evaluate(self, node: Node) -> int:
+        if isinstance(node, Term):
+            return self._term_bits(node.text)
+        if isinstance(node, Not):
+            return self._all & ~self._evaluate(node.child)
+        children = [self._evaluate(child) for child in node.children]
+        bits = children[0]
+        for child_bits in children[1:]:
+            bits = bits & child_bits if isinstance(node, And) else bits | child_bits
+        return bits
+
+    def search(
+        self,
+        node: Node,
+        status: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        before_id: int | None = None,
+    ) -> tuple[int, list[int]]:
+        """
+        Evaluate a normalized boolean query AST. before_id continues a cursor-paginated
+        listing below the last id of the previous page.
+
+        Returns:
+            tuple: (total matches, one page of candidate ids, newest first)
+        """
+        bits = self._evaluate(node)
+        if status is not None:
+            bits &= self._status_bits.get(getattr(status, "value", status), 0)
+        if before_id is not None:
+            bits &= (1 << max(before_id, 0)) - 1
+        return bits.bit_count(), _page_of_ids(bits, skip, limit)
+
+
+skill_index = SkillIndex()
+
+
+async def run_skill_index_refresher(session_maker) -> None:
+    """Load the index, then refresh it every SKILL_INDEX_REFRESH_SECONDS until cancelled"""
+    while True:
+        try:
+            async with session_maker() as db:
+                await skill_index.refresh(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Skill index refresh failed: {e}")
+        await asyncio.sleep(settings.SKILL_INDEX_REFRESH_SECONDS)
@@ -1,20 +1,43 @@
 import os
 import uuid
+import hashlib
+import zipfile
+import asyncio
+import logging
+import weakref
+import multiprocessing
+import threading
 import aiofiles
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from fastapi import UploadFile, HTTPException, status
 from app.core.config import settings
 import PyPDF2
 from docx import Document
-import io
 
+logger = logging.getLogger(__name__)
 
-async def save_upload_file(upload_file: UploadFile) -> tuple[str, int]:
+PAGE_BREAK = "\f"
+
+_extraction_pool: ProcessPoolExecutor | None = None
+# Completes once every worker of _extraction_pool has started
+_extraction_pool_started: list[Future] = []
+_worker_start_barrier: threading.Barrier | None = None
+# Every worker of _extraction_pool, including recycled ones, reports its PID here
+_extraction_worker_pids = None
+# Per event loop, admits only as many jobs as the pool has workers, so a job's timeout
+# starts when it starts running rather than while it waits in the pool's queue
+_extraction_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+async def save_upload_file(upload_file: UploadFile) -> tuple[str, int, str]:
     """
-    Save uploaded file and return file path and size
+    Stream uploaded file to disk in fixed-size chunks and return file path, size and digest.
+    The size limit is enforced while bytes arrive, so at most one chunk is held in memory.
 
     Returns:
-        tuple: (file_path, file_size)
+        tuple: (file_path, file_size, file_hash) where file_hash is the SHA-256 hex digest
     """
     # Validate file extension
     file_ext = upload_file.filename.split(".")[-1].lower()
@@ -31,33 +54,147 @@ async def save_upload_file(upload_file: UploadFile) -> tuple[str, int]:
     # Ensure upload directory exists
     Path(settings.UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
 
-    # Save file
+    file_size, file_hash = await _stream_upload_to_disk(upload_file, file_path, settings.MAX_UPLOAD_SIZE)
+    return file_path, file_size, file_hash
+
+
+async def _stream_upload_to_disk(upload_file: UploadFile, file_path: str, max_size: int) -> tuple[int, str]:
+    """
+    Copy an upload to file_path chunk by chunk, aborting once max_size is crossed.
+    The partial file is removed on any failure.
+
+    Returns:
+        tuple: (file_size, file_hash)
+    """
     file_size = 0
-    async with aiofiles.open(file_path, "wb") as f:
-        content = await upload_file.read()
-        file_size = len(content)
+    hasher = hashlib.sha256()
+    try:
+        async with aiofiles.open(file_path, "wb") as f:
+            while True:
+                chunk = await upload_file.read(settings.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                file_size += len(chunk)
 
-        # Check file size
-        if file_size > settings.MAX_UPLOAD_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE} bytes",
-            )
+                # Abort as soon as the limit is crossed instead of after the full read
+                if file_size > max_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"File size exceeds maximum allowed size of {max_size} bytes",
+                    )
 
-        await f.write(content)
+                hasher.update(chunk)
+                await f.write(chunk)
+    except BaseException:
+        # Remove the partially written file
+        await delete_file(file_path)
+        raise
 
-    return file_path, file_size
+    return file_size, hasher.hexdigest()
 
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text content from PDF file"""
+async def save_upload_archive(upload_file: UploadFile) -> str:
+    """
+    Stream an uploaded ZIP archive to disk, enforcing MAX_ARCHIVE_SIZE.
+
+    Returns:
+        str: Path of the saved archive (caller is responsible for deleting it)
+    """
+    if not upload_file.filename.lower().endswith(".zip"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Archive must be a .zip file",
+        )
+
+    Path(settings.UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
+    archive_path = os.path.join(settings.UPLOAD_DIR, f"{uuid.uuid4()}.zip")
+    await _stream_upload_to_disk(upload_file, archive_path, settings.MAX_ARCHIVE_SIZE)
+    return archive_path
+
+
+def extract_archive_members(
+    archive_path: str, max_files: int | None = None
+) -> tuple[list[tuple[str, str, int, str]], list[tuple[str, str]]]:
+    """
+    Stream each resume member of a ZIP archive into UPLOAD_DIR.
+    Members are copied chunk by chunk with the per-file MAX_UPLOAD_SIZE enforced on the
+    decompressed bytes, so a crafted archive cannot expand beyond the limit. At most
+    max_files members (default BULK_UPLOAD_MAX_FILES) are written; the rest are skipped.
+
+    Returns:
+        tuple: (saved, skipped) where saved holds (filename, file_path, file_size, file_hash)
+               and skipped holds (filename, reason)
+    """
+    if max_files is None:
+        max_files = settings.BULK_UPLOAD_MAX_FILES
+    saved = []
+    skipped = []
+
+    try:
+        archive = zipfile.ZipFile(archive_path)
+    except zipfile.BadZipFile:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded archive is not a valid ZIP file",
+        )
+
+    with archive:
+        for member in archive.infolist():
+            # Drop directory components to avoid path traversal
+            filename = os.path.basename(member.filename)
+            if member.is_dir() or not filename or filename.startswith(".") or member.filename.startswith("__MACOSX/"):
+                continue
+
+            file_ext = filename.split(".")[-1].lower()
+            if file_ext not in settings.allowed_extensions_list:
+                skipped.append((filename, f"File type not allowed. Allowed types: {settings.ALLOWED_EXTENSIONS}"))
+                continue
+
+            if len(saved) >= max_files:
+                skipped.append((filename, f"Upload exceeds maximum of {settings.BULK_UPLOAD_MAX_FILES} files"))
+                continue
+
+            file_path = os.path.join(settings.UPLOAD_DIR, f"{uuid.uuid4()}_{filename}")
+            file_size = 0
+            hasher = hashlib.sha256()
+            try:
+                with archive.open(member) as source, open(file_path, "wb") as target:
+                    while True:
+                        chunk = source.read(settings.UPLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        file_size += len(chunk)
+                        if file_size > settings.MAX_UPLOAD_SIZE:
+                            raise ValueError(
+                                f"File size exceeds maximum allowed size of {settings.MAX_UPLOAD_SIZE} bytes"
+                            )
+                        hasher.update(chunk)
+                        target.write(chunk)
+            except Exception as e:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                skipped.append((filename, str(e)))
+                continue
+
+            saved.append((filename, file_path, file_size, hasher.hexdigest()))
+
+    return saved, skipped
+
+
+def extract_text_from_pdf(file_path: str, max_pages: int | None = None) -> str:
+    """Extract text content from PDF file, reading at most max_pages pages"""
+    if max_pages is None:
+        max_pages = settings.EXTRACTION_MAX_PAGES
     try:
         with open(file_path, "rb") as file:
             pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            pages = pdf_reader.pages
+            if len(pages) > max_pages:
+                logger.warning(f"PDF {file_path} has {len(pages)} pages, extracting only the first {max_pages}")
+            texts = [pages[i].extract_text() for i in range(min(len(pages), max_pages))]
+            # Pages stay separated by a form feed so per-page headers and footers can be found
+            return PAGE_BREAK.join(texts).strip()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -93,6 +230,131 @@ def extract_text_from_file(file_path: str) -> str:
         )
 
 
+def _extract_text_in_worker(file_path: str) -> str:
+    """Process-pool entry point; HTTPException does not pickle, so errors cross as ValueError"""
+    try:
+        return extract_text_from_file(file_path)
+    except HTTPException as e:
+        raise ValueError(e.detail)
+
+
+def _init_extraction_worker(start_barrier, worker_pids) -> None:
+    global _worker_start_barrier
+    _worker_start_barrier = start_barrier
+    worker_pids.put(os.getpid())
+
+
+def _wait_for_worker_start() -> None:
+    """Warm-up job: returns once every worker is running one, so all workers have started"""
+    try:
+        _worker_start_barrier.wait(timeout=settings.EXTRACTION_TIMEOUT_SECONDS)
+    except threading.BrokenBarrierError:
+        pass
+
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """Return the shared extraction process pool, creating it on first use"""
+    global _extraction_pool, _extraction_pool_started, _extraction_worker_pids
+    if _extraction_pool is None:
+        context = multiprocessing.get_context("spawn")
+        start_barrier = context.Barrier(settings.EXTRACTION_POOL_WORKERS)
+        _extraction_worker_pids = context.SimpleQueue()
+        # Workers are replaced after a fixed number of jobs to contain PyPDF2 memory growth
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=settings.EXTRACTION_POOL_WORKERS,
+            max_tasks_per_child=settings.EXTRACTION_MAX_TASKS_PER_CHILD,
+            mp_context=context,
+            initializer=_init_extraction_worker,
+            initargs=(start_barrier, _extraction_worker_pids),
+        )
+        _extraction_pool_started = [
+            _extraction_pool.submit(_wait_for_worker_start) for _ in range(settings.EXTRACTION_POOL_WORKERS)
+        ]
+        logger.info(f"Started text extraction pool with {settings.EXTRACTION_POOL_WORKERS} workers")
+    return _extraction_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Shut down the extraction process pool if it was started"""
+    global _extraction_pool
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=False, cancel_futures=True)
+        _extraction_pool = None
+
+
+def terminate_extraction_pool() -> None:
+    """
+    Kill the extraction pool's worker processes and drop the pool. A running job
+    cannot be cancelled, so this is the only way to free a worker stuck in PyPDF2.
+    """
+    global _extraction_pool, _extraction_worker_pids
+    pool, worker_pids = _extraction_pool, _extraction_worker_pids
+    if pool is None:
+        return
+    _extraction_pool = _extraction_worker_pids = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    pids = set()
+    while not worker_pids.empty():
+        pids.add(worker_pids.get())
+    worker_pids.close()
+    # Only live children of this process, so a reused PID can never hit anything else
+    for process in multiprocessing.active_children():
+        if process.pid in pids:
+            process.terminate()
+
+
+def _extraction_slot() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slot = _extraction_slots.get(loop)
+    if slot is None:
+        slot = _extraction_slots[loop] = asyncio.Semaphore(settings.EXTRACTION_POOL_WORKERS)
+    return slot
+
+
+async def extract_text_from_file_async(file_path: str) -> str:
+    """
+    Extract text without blocking the event loop.
+    Runs in the extraction process pool (or a thread when the pool is disabled)
+    and gives up after EXTRACTION_TIMEOUT_SECONDS of running. On timeout the pool's
+    workers are killed and a fresh pool is started for the next job; a thread
+    cannot be killed, so with the pool disabled a stuck extraction keeps its thread.
+
+    Raises:
+        ValueError: If extraction fails or times out
+    """
+    timeout = settings.EXTRACTION_TIMEOUT_SECONDS
+    if settings.EXTRACTION_POOL_WORKERS <= 0:
+        try:
+            return await asyncio.wait_for(asyncio.to_thread(_extract_text_in_worker, file_path), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise ValueError(f"Text extraction timed out after {timeout} seconds")
+
+    loop = asyncio.get_running_loop()
+    async with _extraction_slot():
+        for attempt in range(2):
+            pool = get_extraction_pool()
+            try:
+                # Worker start-up (importing PyPDF2 and the app) is not part of the timeout
+                await asyncio.gather(*(asyncio.wrap_future(started) for started in _extraction_pool_started))
+                future = loop.run_in_executor(pool, _extract_text_in_worker, file_path)
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Text extraction of {file_path} timed out after {timeout} seconds, recycling pool")
+                if _extraction_pool is pool:
+                    terminate_extraction_pool()
+                raise ValueError(f"Text extraction timed out after {timeout} seconds")
+            except BrokenProcessPool:
+                if _extraction_pool is not pool and attempt == 0:
+                    # The pool was recycled because another job timed out; run again on the new one
+                    continue
+                # A worker died (e.g. out of memory); start a fresh pool for the next job
+                logger.error("Text extraction worker terminated abruptly, restarting pool")
+                if _extraction_pool is pool:
+                    shutdown_extraction_pool()
+                raise ValueError("Text extraction worker terminated abruptly")
+
+
 async def delete_file(file_path: str) -> bool:
     """Delete a file from the filesystem"""
     try:
@@ -0,0 +1,64 @@
+import phonenumbers
+from app.core.config import settings
+
+
+def normalize_email(email: str | None) -> str | None:
+    """Lower-case and trim an email address for dedup lookups"""
+    if not email:
+        return None
+    email = email.strip().lower()
+    return email or None
+
+
+def normalize_phone(phone: str | None, region: str | None = None) -> str | None:
+    """
+    Normalize a phone number to E.164 (e.g. "+15551234567") for dedup lookups.
+    Numbers without a country code are read in DEFAULT_PHONE_REGION.
+    Returns None for values that cannot be a phone number.
+    """
+    if not phone:
+        return None
+    try:
+        number = phonenumbers.parse(phone, region or settings.DEFAULT_PHONE_REGION)
+    except phonenumbers.NumberParseException:
+        return None
+    if not phonenumbers.is_possible_number(number):
+        return None
+    return phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.E164)
+
+
+def candidate_contact_key(email_normalized: str | None, phone_normalized: str | None) -> str | None:
+    """
+    Unique contact key for a candidate: the normalized email, or the E.164 phone when
+    there is no email. The two can never collide since only emails contain "@".
+    It stops two rows from claiming the same contact (e.g. through PATCH); uploads
+    match existing candidates on email OR phone, see contact_match_statement.
+    """
+    return email_normalized or phone_normalized
+
+
+def normalize_term(term: str | None) -> str | None:
+    """Canonical form of a skill or job title: lower-cased with whitespace collapsed"""
+    if not term:
+        return None
+    term = " ".join(str(term).split()).lower()
+    return term or None
+
+
+def normalize_terms(terms: list[str] | None) -> list[str]:
+    """Canonical, de-duplicated terms in their original order"""
+    result = []
+    for term in terms or []:
+        term = normalize_term(term)
+        if term and term not in result:
+            result.append(term)
+    return result
+
+
+def candidate_search_text(skills: list[str] | None, designations: list[str] | None) -> str | None:
+    """
+    Flatten canonical skills and designations into one text value for trigram search.
+    Terms are newline-separated so a search pattern cannot match across two terms.
+    """
+    terms = normalize_terms(skills) + normalize_terms(designations)
+    return "\n".join(terms) or None
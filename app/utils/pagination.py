@@ -0,0 +1,77 @@
+import base64
+import json
+from datetime import datetime
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+from app.models.candidate import Candidate
+
+# Response header carrying the cursor of the next page; absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values) -> str:
+    """Encode the sort key of the last row of a page as an opaque URL-safe token"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """Decode a cursor token into its size sort-key values"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("unexpected cursor shape")
+        return values
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def decode_created_at_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a (created_at, id) cursor"""
+    created_at, candidate_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(candidate_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    """Decode a (rank, id) cursor from a relevance-ordered search"""
+    rank, candidate_id = decode_cursor(cursor, 2)
+    try:
+        return float(rank), int(candidate_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def created_at_keyset(query, cursor: str | None, limit: int):
+    """
+    Order a Candidate query newest first on (created_at, id) and fetch one row past
+    the page, continuing after cursor. Served by ix_candidates_created_at_id, so
+    every page costs the same however deep it is.
+    """
+    if cursor:
+        created_at, candidate_id = decode_created_at_cursor(cursor)
+        query = query.where(tuple_(Candidate.created_at, Candidate.id) < tuple_(created_at, candidate_id))
+    return query.order_by(Candidate.created_at.desc(), Candidate.id.desc()).limit(limit + 1)
+
+
+def finish_page(response: Response, rows: list, limit: int, cursor_key) -> list:
+    """
+    Trim the extra row fetched by a keyset query and, when there is a next page,
+    set its cursor (built from cursor_key(last_row)) in the X-Next-Cursor header.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*cursor_key(rows[-1]))
+    return rows
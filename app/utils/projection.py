@@ -0,0 +1,80 @@
+from fastapi import HTTPException, Response, status
+from app.models.candidate import Candidate
+from app.schemas.candidate import Candidate as CandidateSchema, CandidateSummary
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.responses import FastJSONResponse
+
+# Fields of the full candidate response that map to a Candidate column
+CANDIDATE_COLUMN_FIELDS = [name for name in CandidateSchema.model_fields if hasattr(Candidate, name)]
+CANDIDATE_FIELDS = CANDIDATE_COLUMN_FIELDS + ["download_url"]
+SUMMARY_FIELDS = list(CandidateSummary.model_fields)
+VIEWS = ("full", "summary")
+
+# Always selected: identity and the keyset pagination key
+_REQUIRED_COLUMNS = ("id", "created_at")
+
+
+def parse_fields(fields: str | None, view: str = "full") -> list[str]:
+    """Resolve the fields= sparse fieldset and view= parameters into the response fields"""
+    if view not in VIEWS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown view '{view}'. Allowed views: {', '.join(VIEWS)}",
+        )
+    if fields:
+        names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        unknown = [name for name in names if name not in CANDIDATE_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}. Allowed fields: {', '.join(CANDIDATE_FIELDS)}",
+            )
+        if names:
+            return names
+    if view == "summary":
+        return SUMMARY_FIELDS
+    return CANDIDATE_FIELDS
+
+
+def candidate_columns(field_names: list[str]) -> list:
+    """Candidate columns to select for field_names, always including id and created_at"""
+    names = dict.fromkeys(_REQUIRED_COLUMNS)
+    names.update(dict.fromkeys(name for name in field_names if name in CANDIDATE_COLUMN_FIELDS))
+    return [getattr(Candidate, name) for name in names]
+
+
+def serialize_rows(rows: list, field_names: list[str]) -> list[dict]:
+    """
+    Turn rows selected with candidate_columns into response dicts without model
+    validation: the values come straight from typed database columns.
+
+    Raises:
+        ValueError: If a field is neither a selected column nor download_url
+    """
+    if not rows:
+        return []
+    keys = rows[0]._fields
+    positions = []
+    for name in field_names:
+        if name in keys:
+            positions.append(keys.index(name))
+        elif name == "download_url":
+            positions.append(None)
+        else:
+            raise ValueError(f"Field '{name}' was not selected")
+    id_position = keys.index("id")
+    items = []
+    for row in rows:
+        items.append({
+            name: row[position] if position is not None else f"/candidates/{row[id_position]}/download"
+            for name, position in zip(field_names, positions)
+        })
+    return items
+
+
+def render_candidates(response: Response, rows: list, field_names: list[str]) -> FastJSONResponse:
+    """Serialize a page of candidate rows with orjson, carrying over the X-Next-Cursor header"""
+    headers = {}
+    if NEXT_CURSOR_HEADER in response.headers:
+        headers[NEXT_CURSOR_HEADER] = response.headers[NEXT_CURSOR_HEADER]
+    return FastJSONResponse(content=serialize_rows(rows, field_names), headers=headers)
@@ -0,0 +1,13 @@
+from fastapi.responses import JSONResponse
+import orjson
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson. Content must already be plain data (dicts,
+    lists, str/int/float/bool/None, datetimes, enums); nothing is validated.
+    Timezone-aware UTC datetimes are written with a "Z" suffix like pydantic does.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
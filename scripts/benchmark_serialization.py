@@ -0,0 +1,90 @@
+"""
+Microbenchmark: per-row cost of serializing candidate list pages
+Run with: python -m scripts.benchmark_serialization [rows_per_page] [repeats]
+
+Compares the response_model path (ORM objects validated into CandidateSchema,
+dumped in JSON mode, then json.dumps) with the fast path (column rows turned
+into dicts and encoded with orjson), for the full and summary views.
+"""
+import json
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from typing import List
+from pydantic import TypeAdapter
+from app.models.candidate import Candidate, CandidateStatus
+from app.schemas.candidate import Candidate as CandidateSchema
+from app.utils.projection import CANDIDATE_FIELDS, SUMMARY_FIELDS, candidate_columns, serialize_rows
+from app.utils.responses import FastJSONResponse
+
+
+def make_candidate_values(index: int) -> dict:
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=index)
+    return {
+        "id": index,
+        "filename": f"resume_{index}.pdf",
+        "file_path": f"uploads/{index:08d}_resume_{index}.pdf",
+        "file_size": 200000 + index,
+        "file_hash": f"{index:064x}",
+        "status": CandidateStatus.COMPLETED,
+        "name": f"Candidate {index}",
+        "email": f"candidate{index}@example.com",
+        "phone": f"+1555{index % 10000000:07d}",
+        "skills": ["Python", "Django", "FastAPI", "PostgreSQL", "Docker", "Kubernetes", "AWS", "Redis"],
+        "designations": ["Senior Software Engineer", "Backend Developer"],
+        "domain_knowledge": "Backend development with focus on RESTful APIs, distributed systems and data pipelines. " * 3,
+        "uploaded_by": 1,
+        "error_message": None,
+        "created_at": created_at,
+        "updated_at": created_at,
+        "processed_at": created_at,
+    }
+
+
+def time_per_row(function, rows: int, repeats: int) -> float:
+    """Best-of-repeats wall time per row, in microseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best / rows * 1_000_000
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    values = [make_candidate_values(index) for index in range(1, rows + 1)]
+    orm_objects = [Candidate(**value) for value in values]
+    adapter = TypeAdapter(List[CandidateSchema])
+
+    def response_model_path():
+        validated = adapter.validate_python(orm_objects, from_attributes=True)
+        return json.dumps(adapter.dump_python(validated, mode="json")).encode()
+
+    results = {"response_model (full)": time_per_row(response_model_path, rows, repeats)}
+
+    for view, field_names in (("full", CANDIDATE_FIELDS), ("summary", SUMMARY_FIELDS)):
+        column_names = [column.key for column in candidate_columns(field_names)]
+        Row = namedtuple("Row", column_names)
+        column_rows = [Row(*(value[name] for name in column_names)) for value in values]
+
+        def fast_path():
+            return FastJSONResponse(content=serialize_rows(column_rows, field_names)).body
+
+        results[f"orjson rows ({view})"] = time_per_row(fast_path, rows, repeats)
+        results[f"payload bytes/row ({view})"] = len(fast_path()) / rows
+
+    print(f"{rows} rows per page, best of {repeats}")
+    baseline = results["response_model (full)"]
+    for name, value in results.items():
+        if name.startswith("payload"):
+            print(f"  {name:<28} {value:8.0f}")
+        else:
+            print(f"  {name:<28} {value:8.2f} us/row  ({baseline / value:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Script to write a columnar (Parquet or Arrow IPC) snapshot of candidates for analytics
+Run with: python -m scripts.export_snapshot [--format parquet|arrow] [--incremental | --since ISO_DATETIME] [--output PATH]
+
+Incremental snapshots contain candidates updated since the watermark of the newest
+snapshot in SNAPSHOT_DIR (or --since). Rows may repeat across snapshots; keep the one
+with the latest updated_at per id. Deletions are only reflected by a full snapshot.
+"""
+import argparse
+import asyncio
+from datetime import datetime
+from app.db.base import engine
+from app.services.candidate_snapshot import SNAPSHOT_FORMATS, write_snapshot, latest_watermark
+
+
+async def export_snapshot(format: str, incremental: bool, since: datetime | None, output: str | None):
+    if incremental and since is None:
+        since = latest_watermark()
+        if since is None:
+            print("No previous snapshot found, writing a full snapshot")
+
+    try:
+        snapshot = await write_snapshot(format, since=since, path=output)
+    finally:
+        await engine.dispose()
+
+    print(f"Snapshot written: {snapshot['path']}")
+    print(f"Rows: {snapshot['rows']}")
+    print(f"Size: {snapshot['size']} bytes")
+    print(f"Watermark: {snapshot['watermark'].isoformat()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--format", choices=SNAPSHOT_FORMATS, default="parquet")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--incremental", action="store_true", help="Only candidates updated since the newest snapshot")
+    group.add_argument("--since", type=datetime.fromisoformat, help="Only candidates updated since this time")
+    parser.add_argument("--output", help="Output file (default: a timestamped file in SNAPSHOT_DIR)")
+    args = parser.parse_args()
+
+    asyncio.run(export_snapshot(args.format, args.incremental, args.since, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import pytest
+from app.services.boolean_query import (
+    And,
+    BooleanQueryError,
+    Not,
+    Or,
+    Term,
+    normalize,
+    normalized_query,
+    parse_query,
+    to_query_string,
+    tokenize,
+)
+
+
+def test_tokenize_groups_bare_words_into_one_term():
+    assert tokenize("Ruby on Rails and Go") == [("term", "Ruby on Rails"), ("and", "and"), ("term", "Go")]
+
+
+def test_tokenize_quoted_phrase_keeps_operators():
+    assert tokenize('"research and development" OR (c)') == [
+        ("term", "research and development"),
+        ("or", "OR"),
+        ("(", "("),
+        ("term", "c"),
+        (")", ")"),
+    ]
+
+
+def test_empty_query_parses_to_none():
+    assert parse_query("   ") is None
+    assert normalized_query("") is None
+
+
+def test_and_binds_tighter_than_or():
+    assert parse_query("a or b and c") == Or((Term("a"), And((Term("b"), Term("c")))))
+    assert parse_query("a and b or c") == Or((And((Term("a"), Term("b"))), Term("c")))
+
+
+def test_parentheses_override_precedence():
+    assert parse_query("(a or b) and c") == And((Or((Term("a"), Term("b"))), Term("c")))
+
+
+def test_not_binds_to_the_next_operand():
+    assert parse_query("not a and b") == And((Not(Term("a")), Term("b")))
+    assert parse_query("not (a or b)") == Not(Or((Term("a"), Term("b"))))
+
+
+def test_adjacent_operands_are_anded():
+    assert parse_query("(a or b) c") == And((Or((Term("a"), Term("b"))), Term("c")))
+    assert parse_query("a not b") == And((Term("a"), Not(Term("b"))))
+
+
+@pytest.mark.parametrize("query", ["(a or b", "a or", "not", "a and )", ") a", "a or or b", "()"])
+def test_malformed_queries_raise(query):
+    with pytest.raises(BooleanQueryError):
+        parse_query(query)
+
+
+def test_boolean_query_error_is_a_value_error():
+    assert issubclass(BooleanQueryError, ValueError)
+
+
+def test_normalize_canonicalizes_equivalent_queries():
+    assert normalized_query("go and python") == normalized_query("Python AND (Go)")
+    assert normalized_query("a or (b or a)") == Or((Term("a"), Term("b")))
+
+
+def test_normalize_removes_double_negation_and_empty_terms():
+    assert normalize(parse_query("not not  Python ")) == Term("python")
+    assert normalize(parse_query('"" or go')) == Term("go")
+    assert normalize(parse_query('""')) is None
+
+
+def test_to_query_string_round_trips():
+    node = normalized_query('(python or go) and not "project manager"')
+    assert to_query_string(node) == '(("go" or "python") and not "project manager")'
+    assert normalize(parse_query(to_query_string(node))) == node
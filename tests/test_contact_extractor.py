@@ -0,0 +1,75 @@
+import pytest
+from app.services.contact_extractor import (
+    ContactDetails,
+    cross_check_contact,
+    extract_contact_details,
+    iter_phone_numbers,
+    phone_digits,
+)
+
+
+def test_extracts_emails_in_order_lower_cased_without_duplicates():
+    text = "Jane.Doe@Example.com | jane.doe@example.com\nAlt: j_doe+jobs@mail.co.uk."
+    assert extract_contact_details(text).emails == ["jane.doe@example.com", "j_doe+jobs@mail.co.uk"]
+
+
+@pytest.mark.parametrize("phone", [
+    "+1 (415) 555-0132",
+    "415.555.0132",
+    "+91 98765 43210",
+    "(020) 7946 0958",
+    "+44-20-7946-0958",
+])
+def test_extracts_phone_formats(phone):
+    assert extract_contact_details(f"Phone: {phone}\n").phones == [phone]
+
+
+@pytest.mark.parametrize("text", [
+    "Worked 2015 - 2019 at Acme",  # date range
+    "2019-01-01 to 2020-12-31",
+    "Order id 12345",
+    "Ref 1234 5678 9012 3456",  # more than 15 digits
+    "ab4155550132",  # glued to a word
+])
+def test_ignores_numbers_that_are_not_phones(text):
+    assert extract_contact_details(text).phones == []
+
+
+def test_country_code_variants_are_one_phone():
+    contact = extract_contact_details("+1 415 555 0132\n(415) 555-0132")
+    assert contact.phones == ["+1 415 555 0132"]
+    assert contact.phone == "+1 415 555 0132"
+
+
+def test_empty_text():
+    contact = extract_contact_details("")
+    assert contact == ContactDetails()
+    assert contact.email is None and contact.phone is None
+
+
+def test_phone_digits():
+    assert phone_digits("+1 (415) 555-0132") == "14155550132"
+
+
+def test_cross_check_keeps_matching_values():
+    contact = ContactDetails(emails=["jane@example.com"], phones=["+1 415 555 0132"])
+    assert cross_check_contact("Jane@Example.com", "(415) 555-0132", contact) == (
+        "Jane@Example.com",
+        "(415) 555-0132",
+        [],
+    )
+
+
+def test_cross_check_replaces_missing_and_unknown_values():
+    contact = ContactDetails(emails=["jane@example.com"], phones=["+1 415 555 0132"])
+    email, phone, issues = cross_check_contact(None, "555 000 1111 22", contact)
+    assert (email, phone) == ("jane@example.com", "+1 415 555 0132")
+    assert issues == ["email missing from LLM result", "LLM phone 555 000 1111 22 not found in document"]
+
+
+def test_cross_check_without_local_contact_keeps_llm_values():
+    assert cross_check_contact("a@b.co", "123", ContactDetails()) == ("a@b.co", "123", [])
+
+
+def test_iter_phone_numbers_skips_short_numbers():
+    assert list(iter_phone_numbers("2015 - 2019\nCall +1 415 555 0132")) == ["+1 415 555 0132"]
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+import pytest
+from fastapi import HTTPException, Response
+from app.utils.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_created_at_cursor,
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    finish_page,
+)
+
+
+def test_created_at_cursor_round_trips():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at, 42)
+    assert "=" not in cursor
+    assert decode_created_at_cursor(cursor) == (created_at, 42)
+
+
+def test_rank_cursor_round_trips():
+    assert decode_rank_cursor(encode_cursor(0.0625, 7)) == (0.0625, 7)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor("??>>??>>", 1)
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", "", encode_cursor(1, 2, 3), encode_cursor("x")])
+def test_malformed_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, 2)
+    assert error.value.status_code == 400
+
+
+@pytest.mark.parametrize("cursor", [encode_cursor("yesterday", 1), encode_cursor("2024-05-01T00:00:00", "x")])
+def test_created_at_cursor_with_bad_values_is_a_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_created_at_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+def test_finish_page_sets_cursor_only_when_more_rows_exist():
+    response = Response()
+    rows = finish_page(response, [(3, "c"), (2, "b"), (1, "a")], 2, lambda row: row)
+    assert rows == [(3, "c"), (2, "b")]
+    assert decode_cursor(response.headers[NEXT_CURSOR_HEADER], 2) == [2, "b"]
+
+    response = Response()
+    assert finish_page(response, [(1, "a")], 2, lambda row: row) == [(1, "a")]
+    assert NEXT_CURSOR_HEADER not in response.headers
@@ -0,0 +1,35 @@
+from collections import namedtuple
+import pytest
+from fastapi import HTTPException
+from app.utils.projection import CANDIDATE_FIELDS, SUMMARY_FIELDS, candidate_columns, parse_fields, serialize_rows
+
+
+def test_parse_fields_defaults_and_views():
+    assert parse_fields(None) == CANDIDATE_FIELDS
+    assert parse_fields(None, "summary") == SUMMARY_FIELDS
+    assert parse_fields(" name, skills ,name") == ["name", "skills"]
+
+
+@pytest.mark.parametrize("fields, view", [("name,salary", "full"), (None, "compact")])
+def test_parse_fields_rejects_unknown_names(fields, view):
+    with pytest.raises(HTTPException) as error:
+        parse_fields(fields, view)
+    assert error.value.status_code == 400
+
+
+def test_candidate_columns_always_include_keyset_columns():
+    assert [column.key for column in candidate_columns(["name", "download_url"])] == ["id", "created_at", "name"]
+
+
+def test_serialize_rows_maps_download_url():
+    Row = namedtuple("Row", ["id", "created_at", "name"])
+    rows = [Row(7, None, "Jane")]
+    assert serialize_rows(rows, ["name", "download_url"]) == [
+        {"name": "Jane", "download_url": "/candidates/7/download"}
+    ]
+
+
+def test_serialize_rows_rejects_fields_that_were_not_selected():
+    Row = namedtuple("Row", ["id", "created_at"])
+    with pytest.raises(ValueError):
+        serialize_rows([Row(7, None)], ["email"])
@@ -0,0 +1,17 @@
+from app.services.resume_classifier import classify_document
+
+
+def test_phone_signal_needs_a_number_on_one_line():
+    assert classify_document("Invoice 12345\n67890 total").signals["phone"] is False
+    assert classify_document("Phone: (415) 555-0132").signals["phone"] is True
+
+
+def test_resume_scores_above_invoice():
+    resume = (
+        "Jane Doe\njane@example.com | +1 415 555 0132\nlinkedin.com/in/janedoe\n"
+        "Experience\nSenior Engineer, Acme 2018 - present\nEngineer, Initech 2014 - 2018\n"
+        "Education\nBSc Computer Science\nSkills\nPython, Go\n"
+    )
+    invoice = "INVOICE\nInvoice number 4411\nBill to: Acme\nAmount due: $1,200\nPayment terms: 30 days\n"
+    assert classify_document(resume).label == "resume"
+    assert classify_document(invoice).score < classify_document(resume).score
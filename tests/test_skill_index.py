@@ -0,0 +1,168 @@
+import asyncio
+import random
+import pytest
+from app.services.boolean_query import And, Not, Or, Term, normalized_query
+from app.services.candidate_search import TRIGRAM_MIN_TERM_LENGTH
+from app.services.skill_index import SkillIndex, _bitset_from_ids, _page_of_ids
+from app.utils.normalization import normalize_terms
+
+VOCABULARY = ["python", "go", "golang", "c", "c++", "java", "javascript", "project manager", "data engineer", "rust"]
+
+
+def sql_matches(node, terms: list[str]) -> bool:
+    """Reference evaluation with the semantics of boolean_query.compile_node"""
+    if isinstance(node, Term):
+        if len(node.text) < TRIGRAM_MIN_TERM_LENGTH:
+            return any(term.startswith(node.text) for term in terms)
+        return any(node.text in term for term in terms)
+    if isinstance(node, Not):
+        return not sql_matches(node.child, terms)
+    results = [sql_matches(child, terms) for child in node.children]
+    return all(results) if isinstance(node, And) else any(results)
+
+
+def build_index(candidates: dict) -> SkillIndex:
+    index = SkillIndex()
+    index.ready = True
+    for candidate_id, (status, skills, designations) in candidates.items():
+        index._apply(candidate_id, status, skills, designations)
+    return index
+
+
+@pytest.fixture
+def candidates():
+    rng = random.Random(7)
+    return {
+        candidate_id: (
+            rng.choice(["new", "reviewed", "rejected"]),
+            rng.sample(VOCABULARY[:7], rng.randint(0, 3)),
+            rng.sample(VOCABULARY[7:], rng.randint(0, 1)),
+        )
+        for candidate_id in range(1, 301)
+    }
+
+
+def expected_ids(candidates, node, status=None):
+    return sorted(
+        (
+            candidate_id
+            for candidate_id, (candidate_status, skills, designations) in candidates.items()
+            if (status is None or candidate_status == status)
+            and sql_matches(node, normalize_terms(skills) + normalize_terms(designations))
+        ),
+        reverse=True,
+    )
+
+
+@pytest.mark.parametrize("query", [
+    "python",
+    "go",  # prefix match: go, golang
+    "c",  # prefix match: c, c++
+    "java",  # substring match: java, javascript
+    "script",
+    "python and not go",
+    "(java or rust) and manager",
+    "not python",
+    "not (c or go) and not engineer",
+    "Data Engineer or (python go)",
+])
+def test_search_matches_sql_semantics(candidates, query):
+    index = build_index(candidates)
+    node = normalized_query(query)
+    expected = expected_ids(candidates, node)
+    assert index.search(node, limit=1000) == (len(expected), expected)
+
+
+def test_search_filters_by_status(candidates):
+    index = build_index(candidates)
+    node = normalized_query("python or go")
+    expected = expected_ids(candidates, node, "reviewed")
+    assert index.search(node, status="reviewed", limit=1000) == (len(expected), expected)
+
+
+def test_not_matches_candidates_without_terms():
+    index = build_index({1: ("new", [], []), 2: ("new", ["Python"], None)})
+    assert index.search(Not(Term("python"))) == (1, [1])
+
+
+def test_paging_with_skip_and_before_id(candidates):
+    index = build_index(candidates)
+    node = normalized_query("java or python")
+    expected = expected_ids(candidates, node)
+    assert index.search(node, skip=5, limit=10)[1] == expected[5:15]
+    # Cursor paging continues below the last id of the previous page
+    pages, before_id = [], None
+    while True:
+        _, page = index.search(node, limit=7, before_id=before_id)
+        if not page:
+            break
+        pages.extend(page)
+        before_id = page[-1]
+    assert pages == expected
+
+
+def test_page_of_ids_spans_words():
+    ids = [0, 1, 63, 64, 65, 127, 128, 1000]
+    bits = _bitset_from_ids(ids)
+    assert _page_of_ids(bits, 0, 100) == sorted(ids, reverse=True)
+    assert _page_of_ids(bits, 1, 3) == [128, 127, 65]
+    assert _page_of_ids(bits, 8, 3) == []
+    assert _page_of_ids(0, 0, 3) == []
+
+
+def test_dense_postings_are_promoted_to_bitsets():
+    index = SkillIndex()
+    index.ready = True
+    index._max_id = 64
+    for candidate_id in range(1, 65):
+        index._apply(candidate_id, "new", ["python"], [])
+    assert isinstance(index._postings["python"], int)
+    assert index.search(Term("python"), limit=3) == (64, [64, 63, 62])
+
+
+def test_updates_and_removals():
+    index = build_index({1: ("new", ["python"], []), 2: ("new", ["go"], [])})
+    index._apply(1, "new", ["rust"], [])
+    assert index.search(Term("python")) == (0, [])
+    assert index.search(Term("rust")) == (1, [1])
+
+    index.update_status(2, "rejected")
+    assert index.search(Term("go"), status="new") == (0, [])
+    assert index.search(Term("go"), status="rejected") == (1, [2])
+
+    index.remove_candidate(2)
+    assert index.search(Term("go")) == (0, [])
+    assert index.search(Not(Term("rust"))) == (0, [])
+
+
+def test_new_terms_update_cached_matches():
+    index = build_index({1: ("new", ["java"], [])})
+    assert index.search(Term("java")) == (1, [1])
+    index._apply(2, "new", ["javascript"], [])
+    assert index.search(Term("java")) == (2, [2, 1])
+
+
+class _IdResult:
+    def __init__(self, ids):
+        self._ids = ids
+
+    def scalars(self):
+        async def ids():
+            for candidate_id in self._ids:
+                yield candidate_id
+        return ids()
+
+
+class _IdSession:
+    def __init__(self, ids):
+        self._ids = ids
+
+    async def stream(self, query):
+        return _IdResult(self._ids)
+
+
+def test_reconcile_drops_deleted_candidates():
+    index = build_index({1: ("new", ["python"], []), 2: ("new", ["python"], []), 3: ("new", ["python"], [])})
+    assert asyncio.run(index.reconcile(_IdSession([1, 3]))) == 1
+    assert index.search(Term("python")) == (2, [3, 1])
+    assert index.search(Or((Term("python"), Not(Term("python"))))) == (2, [3, 1])